@@ -22,26 +22,30 @@ def draw_star(draw, center_x: int, center_y: int, outer_radius: int, inner_radiu
         color: Цвет заливки
         rotation: Угол поворота в градусах (-90 для вершины вверх)
     """
-    vertices = []
-    
-    for i in range(points * 2):
-        # Чередуем внешний и внутренний радиус
-        radius = outer_radius if i % 2 == 0 else inner_radius
-        # Угол для текущей вершины
-        angle = math.radians(rotation + (i * 180 / points))
-        x = center_x + radius * math.cos(angle)
-        y = center_y + radius * math.sin(angle)
-        vertices.append((x, y))
+    # Чередуем внешний и внутренний радиус; шаг угла считаем один раз
+    start = math.radians(rotation)
+    step = math.pi / points
+    radii = (outer_radius, inner_radius)
+    vertices = [
+        (
+            center_x + radii[i & 1] * math.cos(start + i * step),
+            center_y + radii[i & 1] * math.sin(start + i * step),
+        )
+        for i in range(points * 2)
+    ]
     
     draw.polygon(vertices, fill=color)
 
 
-def create_chatlist_icon(output_path: str = "app.ico"):
+def create_chatlist_icon(output_path: str = "app.ico") -> list:
     """
     Создаёт иконку приложения с красной звездой в голубом круге.
     
     Args:
         output_path: Путь для сохранения иконки
+    
+    Returns:
+        Список изображений всех размеров (от 256x256 до 16x16)
     """
     # Размеры иконок для ICO файла
     sizes = [(256, 256), (128, 128), (64, 64), (48, 48), (32, 32), (16, 16)]
@@ -51,50 +55,49 @@ def create_chatlist_icon(output_path: str = "app.ico"):
     circle_color = (100, 180, 255)  # Голубой цвет круга
     star_color = (220, 50, 50)  # Красный цвет звезды
     
-    images = []
-    
-    for size in sizes:
-        width, height = size
-        
-        # Создаём изображение с прозрачным фоном
-        img = Image.new('RGBA', (width, height), background_color)
-        draw = ImageDraw.Draw(img)
-        
-        # Центр и радиус круга
-        center_x = width // 2
-        center_y = height // 2
-        
-        # Отступ для круга (чтобы он вписывался в квадрат)
-        padding = int(min(width, height) * 0.05)
-        circle_radius = min(width, height) // 2 - padding
-        
-        # Рисуем голубой круг
-        circle_bbox = [
-            center_x - circle_radius,
-            center_y - circle_radius,
-            center_x + circle_radius,
-            center_y + circle_radius
-        ]
-        draw.ellipse(circle_bbox, fill=circle_color)
-        
-        # Параметры звезды
-        # Размеры звезды относительно радиуса круга (лучи касаются края)
-        outer_radius = int(circle_radius * 0.95)
-        inner_radius = int(outer_radius * 0.38)  # Соотношение для классической 5-конечной звезды
-        
-        # Рисуем красную звезду
-        draw_star(
-            draw, 
-            center_x, 
-            center_y, 
-            outer_radius, 
-            inner_radius, 
-            points=5, 
-            color=star_color,
-            rotation=-90  # Вершина направлена вверх
-        )
-        
-        images.append(img)
+    # Рисуем иконку один раз в наибольшем размере
+    width, height = sizes[0]
+    
+    # Создаём изображение с прозрачным фоном
+    base = Image.new('RGBA', (width, height), background_color)
+    draw = ImageDraw.Draw(base)
+    
+    # Центр и радиус круга
+    center_x = width // 2
+    center_y = height // 2
+    
+    # Отступ для круга (чтобы он вписывался в квадрат)
+    padding = int(min(width, height) * 0.05)
+    circle_radius = min(width, height) // 2 - padding
+    
+    # Рисуем голубой круг
+    circle_bbox = [
+        center_x - circle_radius,
+        center_y - circle_radius,
+        center_x + circle_radius,
+        center_y + circle_radius
+    ]
+    draw.ellipse(circle_bbox, fill=circle_color)
+    
+    # Параметры звезды
+    # Размеры звезды относительно радиуса круга (лучи касаются края)
+    outer_radius = int(circle_radius * 0.95)
+    inner_radius = int(outer_radius * 0.38)  # Соотношение для классической 5-конечной звезды
+    
+    # Рисуем красную звезду
+    draw_star(
+        draw, 
+        center_x, 
+        center_y, 
+        outer_radius, 
+        inner_radius, 
+        points=5, 
+        color=star_color,
+        rotation=-90  # Вершина направлена вверх
+    )
+    
+    # Остальные размеры — уменьшение готового изображения
+    images = [base] + [base.resize(size, Image.LANCZOS) for size in sizes[1:]]
     
     # Сохраняем все размеры в один ICO файл
     images[0].save(
@@ -106,6 +109,8 @@ def create_chatlist_icon(output_path: str = "app.ico"):
     
     print(f"Иконка успешно создана: {output_path}")
     print(f"Размеры: {[f'{s[0]}x{s[1]}' for s in sizes]}")
+    
+    return images
 
 
 if __name__ == "__main__":
@@ -113,28 +118,9 @@ if __name__ == "__main__":
     script_dir = os.path.dirname(os.path.abspath(__file__))
     icon_path = os.path.join(script_dir, "app.ico")
     
-    create_chatlist_icon(icon_path)
+    images = create_chatlist_icon(icon_path)
     
-    # Создаём также PNG версию для использования в GUI
+    # Создаём также PNG версию для использования в GUI (128x128 из того же рендера)
     png_path = os.path.join(script_dir, "app_icon.png")
-    img_128 = Image.new('RGBA', (128, 128), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img_128)
-    
-    # Рисуем голубой круг
-    padding = int(128 * 0.05)
-    circle_radius = 128 // 2 - padding
-    draw.ellipse([
-        64 - circle_radius,
-        64 - circle_radius,
-        64 + circle_radius,
-        64 + circle_radius
-    ], fill=(100, 180, 255))
-    
-    # Рисуем красную звезду (лучи касаются края круга)
-    outer_radius = int(circle_radius * 0.95)
-    inner_radius = int(outer_radius * 0.38)
-    draw_star(draw, 64, 64, outer_radius, inner_radius, points=5, 
-              color=(220, 50, 50), rotation=-90)
-    
-    img_128.save(png_path, 'PNG')
+    images[1].save(png_path, 'PNG')
     print(f"PNG иконка создана: {png_path}")
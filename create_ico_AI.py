@@ -3,22 +3,35 @@ Script to create ChatList icon with red "AI" letters in a blue circle.
 Generates icon with red text "AI" on blue circle background.
 """
 
+from functools import lru_cache
 from PIL import Image, ImageDraw, ImageFont
-import math
 import os
 
 
-def load_font(size: int) -> ImageFont.FreeTypeFont:
+@lru_cache(maxsize=1)
+def _load_base_font():
     """
-    Load an Arial-based font with fallback to default.
+    Open the Arial TTF face once; sizes are derived from it via font_variant.
+    Returns None when no Arial font is installed.
     """
     try:
-        return ImageFont.truetype("arialbd.ttf", size)
+        return ImageFont.truetype("arialbd.ttf", 10)
     except:
         try:
-            return ImageFont.truetype("arial.ttf", size)
+            return ImageFont.truetype("arial.ttf", 10)
         except:
-            return ImageFont.load_default()
+            return None
+
+
+@lru_cache(maxsize=512)
+def load_font(size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load an Arial-based font with fallback to default.
+    """
+    base_font = _load_base_font()
+    if base_font is None:
+        return ImageFont.load_default()
+    return base_font.font_variant(size=size)
 
 
 def create_ai_icon(output_ico: str = "app_ai.ico"):
@@ -37,61 +50,63 @@ def create_ai_icon(output_ico: str = "app_ai.ico"):
     circle_color = (100, 180, 255)   # Blue circle
     text_color = (220, 50, 50)       # Red text
     
-    images = []
-    
-    for size in sizes:
-        width, height = size
-        
-        # Create image with transparent background
-        img = Image.new('RGBA', (width, height), background_color)
-        draw = ImageDraw.Draw(img)
-        
-        # Center and radius
-        center_x = width // 2
-        center_y = height // 2
-        
-        # Padding for circle
-        padding = int(min(width, height) * 0.05)
-        circle_radius = min(width, height) // 2 - padding
-        
-        # Draw blue circle
-        circle_bbox = [
-            center_x - circle_radius,
-            center_y - circle_radius,
-            center_x + circle_radius,
-            center_y + circle_radius
-        ]
-        draw.ellipse(circle_bbox, fill=circle_color)
-        
-        # Draw "AI" text
-        # MAXIMIZE font size to fill circle but stay inside
-        text = "AI"
-        font_size = int(circle_radius * 2.5)  # Start large
-        font = load_font(font_size)
-        
-        # Shrink until text height ~75% of circle diameter (1.5 * radius)
+    # Draw the icon once at the largest size
+    width, height = sizes[0]
+    
+    # Create image with transparent background
+    base = Image.new('RGBA', (width, height), background_color)
+    draw = ImageDraw.Draw(base)
+    
+    # Center and radius
+    center_x = width // 2
+    center_y = height // 2
+    
+    # Padding for circle
+    padding = int(min(width, height) * 0.05)
+    circle_radius = min(width, height) // 2 - padding
+    
+    # Draw blue circle
+    circle_bbox = [
+        center_x - circle_radius,
+        center_y - circle_radius,
+        center_x + circle_radius,
+        center_y + circle_radius
+    ]
+    draw.ellipse(circle_bbox, fill=circle_color)
+    
+    # Draw "AI" text
+    # MAXIMIZE font size to fill circle but stay inside
+    text = "AI"
+    
+    def fits(size: int) -> bool:
+        # Text height ~75% of circle diameter (1.5 * radius)
         # AND text width fits inside circle too
-        while font_size > 6:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            text_height = bbox[3] - bbox[1]
-            text_width = bbox[2] - bbox[0]
-            
-            # Check both height AND width fit inside circle
-            if text_height <= circle_radius * 1.5 and text_width <= circle_radius * 1.6:
-                break
-            font_size -= 1
-            font = load_font(font_size)
-        
-        bbox = draw.textbbox((0, 0), text, font=font)
-        
-        # Calculate position to center text inside the circle
-        text_x = center_x - (bbox[2] + bbox[0]) // 2
-        text_y = center_y - (bbox[3] + bbox[1]) // 2
-        
-        # Draw red "AI" text
-        draw.text((text_x, text_y), text, fill=text_color, font=font)
-        
-        images.append(img)
+        bbox = draw.textbbox((0, 0), text, font=load_font(size))
+        text_height = bbox[3] - bbox[1]
+        text_width = bbox[2] - bbox[0]
+        return text_height <= circle_radius * 1.5 and text_width <= circle_radius * 1.6
+    
+    # Binary search for the largest font size that fits (6 at minimum)
+    low, high = 6, int(circle_radius * 2.5)  # Start large
+    while low < high:
+        mid = (low + high + 1) // 2
+        if fits(mid):
+            low = mid
+        else:
+            high = mid - 1
+    font = load_font(low)
+    
+    bbox = draw.textbbox((0, 0), text, font=font)
+    
+    # Calculate position to center text inside the circle
+    text_x = center_x - (bbox[2] + bbox[0]) // 2
+    text_y = center_y - (bbox[3] + bbox[1]) // 2
+    
+    # Draw red "AI" text
+    draw.text((text_x, text_y), text, fill=text_color, font=font)
+    
+    # Smaller sizes are downsampled from the rendered image
+    images = [base] + [base.resize(size, Image.LANCZOS) for size in sizes[1:]]
     
     # Save all sizes to one ICO file
     images[0].save(
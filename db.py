@@ -3,14 +3,50 @@
 """
 
 import sqlite3
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, Optional
+
+# Время жизни закэшированного значения настройки, секунды
+SETTINGS_TTL = 30.0
 
 
 class Database:
     """Класс для работы с базой данных ChatList."""
 
+    # SQL горячих CRUD-путей: одинаковые строки гарантируют попадание
+    # в кэш подготовленных выражений sqlite3 (cached_statements)
+    _SQL_ADD_PROMPT = "INSERT INTO prompts (text, tags) VALUES (?, ?)"
+    _SQL_GET_PROMPT = "SELECT * FROM prompts WHERE id = ?"
+    _SQL_GET_MODEL = "SELECT * FROM models WHERE id = ?"
+    _SQL_SAVE_RESULT = """
+        INSERT INTO results
+        (prompt_id, prompt_text, model_id, model_name, response, tokens)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+    _SQL_GET_RESULT = "SELECT * FROM results WHERE id = ?"
+    # Фрагменты фильтра результатов: выборка собирается из них, поэтому
+    # у get_results/iter_results всего несколько вариантов текста SQL
+    _SQL_RESULTS_FTS = " AND id IN (SELECT rowid FROM results_fts WHERE results_fts MATCH ?)"
+    _SQL_RESULTS_LIKE = " AND (prompt_text LIKE ? OR response LIKE ? OR model_name LIKE ?)"
+    _SQL_RESULTS_MODEL = " AND model_id = ?"
+    _SQL_GET_SETTING = "SELECT value FROM settings WHERE key = ?"
+    # Запись того же значения не трогает строку (без перезаписи страницы в WAL)
+    _SQL_SET_SETTING = """
+        INSERT INTO settings (key, value, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(key) DO UPDATE SET
+            value = excluded.value,
+            updated_at = CURRENT_TIMESTAMP
+        WHERE settings.value IS NOT excluded.value
+    """
+
+    # Пути, для которых схема уже создана в этом процессе
+    _schema_initialized: set[str] = set()
+    _schema_lock = threading.Lock()
+
     def __init__(self, db_path: str = "chatlist.db"):
         """
         Инициализация подключения к базе данных.
@@ -20,31 +56,67 @@ class Database:
         """
         self.db_path = Path(db_path)
         self.connection: Optional[sqlite3.Connection] = None
+        self._fts_enabled = False
+        # key -> (момент чтения, значение или None, если настройки нет)
+        self._settings_cache: dict[str, tuple[float, Optional[str]]] = {}
         self._connect()
-        self._create_tables()
+        self._ensure_schema()
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Открыть новое соединение с базой данных с настройками приложения."""
+        connection = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256
+        )
+        connection.row_factory = sqlite3.Row
+
+        # Производительность: WAL убирает лишний fsync на каждый commit
+        # и позволяет читать во время записи. Все PRAGMA идемпотентны.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        connection.execute("PRAGMA cache_size=-64000")  # ~64 МБ кэша страниц
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA mmap_size=268435456")  # чтение страниц через mmap, до 256 МБ
+        connection.execute("PRAGMA busy_timeout=5000")
+        return connection
 
     def _connect(self) -> None:
         """Установить соединение с базой данных."""
-        self.connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
-        self.connection.row_factory = sqlite3.Row
+        self.connection = self._open_connection()
+
+    def _ensure_schema(self) -> None:
+        """Создать схему один раз на файл базы данных в пределах процесса."""
+        key = str(self.db_path.resolve()) if str(self.db_path) != ":memory:" else None
+        if key is None:
+            # У каждого соединения :memory: своя база — схему создаём всегда
+            self._create_tables()
+            return
+        with self._schema_lock:
+            if key not in self._schema_initialized:
+                self._create_tables()
+                self._schema_initialized.add(key)
+                return
+        # Схема уже создана — только узнать, доступны ли индексы FTS
+        row = self.connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'results_fts'"
+        ).fetchone()
+        self._fts_enabled = row is not None
 
     def _create_tables(self) -> None:
         """Создать таблицы, если они не существуют."""
-        cursor = self.connection.cursor()
+        # Вся схема — одним скриптом в одной транзакции
+        self.connection.executescript("""
+            BEGIN;
 
-        # Таблица промптов
-        cursor.execute("""
+            -- Таблица промптов
             CREATE TABLE IF NOT EXISTS prompts (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 text TEXT NOT NULL,
                 tags TEXT DEFAULT '',
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+            );
 
-        # Таблица моделей
-        cursor.execute("""
+            -- Таблица моделей
             CREATE TABLE IF NOT EXISTS models (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL,
@@ -54,11 +126,9 @@ class Database:
                 model_id TEXT NOT NULL,
                 is_active INTEGER DEFAULT 1,
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+            );
 
-        # Таблица результатов
-        cursor.execute("""
+            -- Таблица результатов
             CREATE TABLE IF NOT EXISTS results (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 prompt_id INTEGER,
@@ -70,41 +140,155 @@ class Database:
                 created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (prompt_id) REFERENCES prompts(id) ON DELETE SET NULL,
                 FOREIGN KEY (model_id) REFERENCES models(id) ON DELETE SET NULL
-            )
-        """)
+            );
 
-        # Таблица настроек
-        cursor.execute("""
+            -- Таблица настроек
             CREATE TABLE IF NOT EXISTS settings (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 key TEXT UNIQUE NOT NULL,
                 value TEXT,
                 updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            );
+
+            -- Индексы
+            CREATE INDEX IF NOT EXISTS idx_prompts_created_at ON prompts(created_at);
+            -- Частичный индекс: только активные модели, уже отсортированные по имени
+            DROP INDEX IF EXISTS idx_models_is_active;
+            CREATE INDEX IF NOT EXISTS idx_models_active_only
+                ON models(name) WHERE is_active = 1;
+            CREATE INDEX IF NOT EXISTS idx_results_created_at ON results(created_at);
+            CREATE INDEX IF NOT EXISTS idx_results_model_id ON results(model_id);
+            CREATE INDEX IF NOT EXISTS idx_results_model_created
+                ON results(model_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_results_prompt_id ON results(prompt_id);
+
+            COMMIT;
+        """)
+
+        self._fts_enabled = self._create_fts_tables()
+
+    def _create_fts_tables(self) -> bool:
+        """
+        Создать полнотекстовые индексы FTS5 для поиска по промптам и результатам.
+
+        Используется токенизатор trigram, поэтому поиск остаётся поиском
+        подстроки (как LIKE '%...%'), но идёт по индексу.
+
+        Returns:
+            True, если FTS5 доступен и индексы созданы.
+        """
+        cursor = self.connection.cursor()
+        existing = {
+            row["name"]
+            for row in cursor.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
             )
+        }
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS prompts_fts USING fts5(
+                    text, tags,
+                    content='prompts', content_rowid='id', tokenize='trigram'
+                )
+            """)
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS results_fts USING fts5(
+                    prompt_text, response, model_name,
+                    content='results', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError:
+            # SQLite собран без FTS5 — поиск работает через LIKE
+            self.connection.rollback()
+            return False
+
+        # Триггеры синхронизации индексов с таблицами
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS prompts_fts_ai AFTER INSERT ON prompts BEGIN
+                INSERT INTO prompts_fts(rowid, text, tags)
+                VALUES (new.id, new.text, new.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS prompts_fts_ad AFTER DELETE ON prompts BEGIN
+                INSERT INTO prompts_fts(prompts_fts, rowid, text, tags)
+                VALUES ('delete', old.id, old.text, old.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS prompts_fts_au AFTER UPDATE ON prompts BEGIN
+                INSERT INTO prompts_fts(prompts_fts, rowid, text, tags)
+                VALUES ('delete', old.id, old.text, old.tags);
+                INSERT INTO prompts_fts(rowid, text, tags)
+                VALUES (new.id, new.text, new.tags);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS results_fts_ai AFTER INSERT ON results BEGIN
+                INSERT INTO results_fts(rowid, prompt_text, response, model_name)
+                VALUES (new.id, new.prompt_text, new.response, new.model_name);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS results_fts_ad AFTER DELETE ON results BEGIN
+                INSERT INTO results_fts(results_fts, rowid, prompt_text, response, model_name)
+                VALUES ('delete', old.id, old.prompt_text, old.response, old.model_name);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS results_fts_au AFTER UPDATE ON results BEGIN
+                INSERT INTO results_fts(results_fts, rowid, prompt_text, response, model_name)
+                VALUES ('delete', old.id, old.prompt_text, old.response, old.model_name);
+                INSERT INTO results_fts(rowid, prompt_text, response, model_name)
+                VALUES (new.id, new.prompt_text, new.response, new.model_name);
+            END
         """)
 
-        # Индексы
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_prompts_created_at ON prompts(created_at)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_models_is_active ON models(is_active)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_results_created_at ON results(created_at)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_results_model_id ON results(model_id)"
-        )
-        cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_results_prompt_id ON results(prompt_id)"
-        )
+        # Проиндексировать данные, сохранённые до появления FTS
+        if "prompts_fts" not in existing:
+            cursor.execute("INSERT INTO prompts_fts(prompts_fts) VALUES ('rebuild')")
+        if "results_fts" not in existing:
+            cursor.execute("INSERT INTO results_fts(results_fts) VALUES ('rebuild')")
 
         self.connection.commit()
+        return True
+
+    def _use_fts(self, search: str) -> bool:
+        """Можно ли выполнить поиск через FTS (trigram требует от 3 символов)."""
+        return self._fts_enabled and len(search) >= 3
+
+    @staticmethod
+    def _fts_query(search: str) -> str:
+        """Экранировать строку поиска как фразу FTS5."""
+        return '"' + search.replace('"', '""') + '"'
+
+    def _execute_plain(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        """Выполнить запрос, возвращающий обычные кортежи вместо sqlite3.Row."""
+        cursor = self.connection.cursor()
+        cursor.row_factory = None
+        return cursor.execute(sql, params)
+
+    @staticmethod
+    def _iter_rows(cursor: sqlite3.Cursor, batch_size: int = 256) -> Iterator[dict]:
+        """Выдавать строки курсора словарями, читая их пачками по batch_size."""
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(row)
 
     def close(self) -> None:
         """Закрыть соединение с базой данных."""
         if self.connection:
+            # Сохранить статистику планировщика и обрезать WAL-файл,
+            # чтобы первые запросы следующего запуска были быстрее
+            try:
+                self.connection.execute("PRAGMA optimize")
+                self.connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                pass
             self.connection.close()
             self.connection = None
 
@@ -121,11 +305,7 @@ class Database:
         Returns:
             ID созданного промпта.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            "INSERT INTO prompts (text, tags) VALUES (?, ?)",
-            (text, tags),
-        )
+        cursor = self.connection.execute(self._SQL_ADD_PROMPT, (text, tags))
         self.connection.commit()
         return cursor.lastrowid
 
@@ -143,9 +323,34 @@ class Database:
         Returns:
             Список промптов.
         """
-        cursor = self.connection.cursor()
-        if search:
-            cursor.execute(
+        return list(self.iter_prompts(search, limit, offset))
+
+    def iter_prompts(
+        self, search: str = "", limit: int = 100, offset: int = 0
+    ) -> Iterator[dict]:
+        """
+        Перебрать промпты порциями, не загружая всю выборку в память.
+
+        Args:
+            search: Строка поиска.
+            limit: Максимальное количество записей.
+            offset: Смещение.
+
+        Yields:
+            Промпты в виде словарей.
+        """
+        if search and self._use_fts(search):
+            cursor = self.connection.execute(
+                """
+                SELECT * FROM prompts
+                WHERE id IN (SELECT rowid FROM prompts_fts WHERE prompts_fts MATCH ?)
+                ORDER BY created_at DESC
+                LIMIT ? OFFSET ?
+                """,
+                (self._fts_query(search), limit, offset),
+            )
+        elif search:
+            cursor = self.connection.execute(
                 """
                 SELECT * FROM prompts 
                 WHERE text LIKE ? OR tags LIKE ?
@@ -155,23 +360,45 @@ class Database:
                 (f"%{search}%", f"%{search}%", limit, offset),
             )
         else:
-            cursor.execute(
+            cursor = self.connection.execute(
                 "SELECT * FROM prompts ORDER BY created_at DESC LIMIT ? OFFSET ?",
                 (limit, offset),
             )
+        yield from self._iter_rows(cursor)
+
+    def get_prompt_previews(self, limit: int = 50, length: int = 50) -> list[dict]:
+        """
+        Получить последние промпты с текстом, обрезанным в SQL.
+
+        Args:
+            limit: Максимальное количество записей.
+            length: Длина превью в символах.
+
+        Returns:
+            Список словарей с полями id и preview.
+        """
+        cursor = self.connection.execute(
+            """
+            SELECT id,
+                   SUBSTR(text, 1, ?)
+                       || CASE WHEN LENGTH(text) > ? THEN '...' ELSE '' END
+                       AS preview
+            FROM prompts
+            ORDER BY created_at DESC
+            LIMIT ?
+            """,
+            (length, length, limit),
+        )
         return [dict(row) for row in cursor.fetchall()]
 
     def get_prompt_by_id(self, prompt_id: int) -> Optional[dict]:
         """Получить промпт по ID."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM prompts WHERE id = ?", (prompt_id,))
-        row = cursor.fetchone()
+        row = self.connection.execute(self._SQL_GET_PROMPT, (prompt_id,)).fetchone()
         return dict(row) if row else None
 
     def update_prompt(self, prompt_id: int, text: str, tags: str = "") -> bool:
         """Обновить промпт."""
-        cursor = self.connection.cursor()
-        cursor.execute(
+        cursor = self.connection.execute(
             """
             UPDATE prompts 
             SET text = ?, tags = ?, updated_at = CURRENT_TIMESTAMP
@@ -184,8 +411,7 @@ class Database:
 
     def delete_prompt(self, prompt_id: int) -> bool:
         """Удалить промпт."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM prompts WHERE id = ?", (prompt_id,))
+        cursor = self.connection.execute("DELETE FROM prompts WHERE id = ?", (prompt_id,))
         self.connection.commit()
         return cursor.rowcount > 0
 
@@ -206,8 +432,7 @@ class Database:
         Returns:
             ID созданной модели.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
+        cursor = self.connection.execute(
             """
             INSERT INTO models (name, provider, api_url, api_key_env, model_id, is_active)
             VALUES (?, ?, ?, ?, ?, ?)
@@ -217,6 +442,40 @@ class Database:
         self.connection.commit()
         return cursor.lastrowid
 
+    def add_models(self, models: list[dict]) -> int:
+        """
+        Добавить несколько моделей одной транзакцией.
+
+        Args:
+            models: Словари с ключами name, provider, api_url, api_key_env,
+                model_id и необязательным is_active.
+
+        Returns:
+            Количество добавленных моделей.
+        """
+        if not models:
+            return 0
+        rows = [
+            (
+                m["name"],
+                m["provider"],
+                m["api_url"],
+                m["api_key_env"],
+                m["model_id"],
+                int(m.get("is_active", True)),
+            )
+            for m in models
+        ]
+        with self.connection:
+            self.connection.executemany(
+                """
+                INSERT INTO models (name, provider, api_url, api_key_env, model_id, is_active)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                rows,
+            )
+        return len(rows)
+
     def get_models(self, active_only: bool = False) -> list[dict]:
         """
         Получить список моделей.
@@ -227,20 +486,17 @@ class Database:
         Returns:
             Список моделей.
         """
-        cursor = self.connection.cursor()
         if active_only:
-            cursor.execute(
+            cursor = self.connection.execute(
                 "SELECT * FROM models WHERE is_active = 1 ORDER BY name"
             )
         else:
-            cursor.execute("SELECT * FROM models ORDER BY name")
+            cursor = self.connection.execute("SELECT * FROM models ORDER BY name")
         return [dict(row) for row in cursor.fetchall()]
 
     def get_model_by_id(self, model_id: int) -> Optional[dict]:
         """Получить модель по ID."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM models WHERE id = ?", (model_id,))
-        row = cursor.fetchone()
+        row = self.connection.execute(self._SQL_GET_MODEL, (model_id,)).fetchone()
         return dict(row) if row else None
 
     def update_model(
@@ -254,25 +510,26 @@ class Database:
         is_active: bool = None,
     ) -> bool:
         """Обновить модель."""
-        model = self.get_model_by_id(model_id)
-        if not model:
-            return False
-
-        cursor = self.connection.cursor()
-        cursor.execute(
+        # COALESCE оставляет прежнее значение для незаданных полей —
+        # один UPDATE без предварительного SELECT
+        cursor = self.connection.execute(
             """
             UPDATE models 
-            SET name = ?, provider = ?, api_url = ?, api_key_env = ?, 
-                model_id = ?, is_active = ?
+            SET name = COALESCE(?, name),
+                provider = COALESCE(?, provider),
+                api_url = COALESCE(?, api_url),
+                api_key_env = COALESCE(?, api_key_env),
+                model_id = COALESCE(?, model_id),
+                is_active = COALESCE(?, is_active)
             WHERE id = ?
             """,
             (
-                name if name is not None else model["name"],
-                provider if provider is not None else model["provider"],
-                api_url if api_url is not None else model["api_url"],
-                api_key_env if api_key_env is not None else model["api_key_env"],
-                model_id_str if model_id_str is not None else model["model_id"],
-                int(is_active) if is_active is not None else model["is_active"],
+                name,
+                provider,
+                api_url,
+                api_key_env,
+                model_id_str,
+                int(is_active) if is_active is not None else None,
                 model_id,
             ),
         )
@@ -281,8 +538,7 @@ class Database:
 
     def toggle_model_active(self, model_id: int) -> bool:
         """Переключить активность модели."""
-        cursor = self.connection.cursor()
-        cursor.execute(
+        cursor = self.connection.execute(
             "UPDATE models SET is_active = NOT is_active WHERE id = ?",
             (model_id,),
         )
@@ -291,8 +547,7 @@ class Database:
 
     def delete_model(self, model_id: int) -> bool:
         """Удалить модель."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM models WHERE id = ?", (model_id,))
+        cursor = self.connection.execute("DELETE FROM models WHERE id = ?", (model_id,))
         self.connection.commit()
         return cursor.rowcount > 0
 
@@ -313,13 +568,8 @@ class Database:
         Returns:
             ID созданной записи.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO results 
-            (prompt_id, prompt_text, model_id, model_name, response, tokens)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """,
+        cursor = self.connection.execute(
+            self._SQL_SAVE_RESULT,
             (prompt_id, prompt_text, model_id, model_name, response, tokens),
         )
         self.connection.commit()
@@ -335,18 +585,26 @@ class Database:
         Returns:
             Список ID созданных записей.
         """
-        ids = []
-        for result in results:
-            result_id = self.save_result(
-                prompt_text=result["prompt_text"],
-                model_name=result["model_name"],
-                response=result["response"],
-                prompt_id=result.get("prompt_id"),
-                model_id=result.get("model_id"),
-                tokens=result.get("tokens", 0),
+        if not results:
+            return []
+        rows = [
+            (
+                result.get("prompt_id"),
+                result["prompt_text"],
+                result.get("model_id"),
+                result["model_name"],
+                result["response"],
+                result.get("tokens", 0),
             )
-            ids.append(result_id)
-        return ids
+            for result in results
+        ]
+        # Одна транзакция и один executemany на всю пачку.
+        # Пока транзакция держит блокировку записи, ID выдаются подряд,
+        # поэтому их можно восстановить по последнему вставленному.
+        with self.connection:
+            self.connection.executemany(self._SQL_SAVE_RESULT, rows)
+            last_id = self.connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+        return list(range(last_id - len(rows) + 1, last_id + 1))
 
     def get_results(
         self,
@@ -367,35 +625,148 @@ class Database:
         Returns:
             Список результатов.
         """
-        cursor = self.connection.cursor()
-        query = "SELECT * FROM results WHERE 1=1"
+        return list(self.iter_results(search, model_id, limit, offset))
+
+    def iter_results(
+        self,
+        search: str = "",
+        model_id: int = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> Iterator[dict]:
+        """
+        Перебрать результаты порциями, не загружая всю выборку в память.
+
+        Args:
+            search: Строка поиска.
+            model_id: Фильтр по модели.
+            limit: Максимальное количество записей (-1 — без ограничения).
+            offset: Смещение.
+
+        Yields:
+            Результаты в виде словарей.
+        """
+        where, params = self._results_filter(search, model_id)
+        query = f"SELECT * FROM results WHERE {where} ORDER BY created_at DESC LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        cursor = self.connection.execute(query, params)
+        yield from self._iter_rows(cursor)
+
+    def count_results(self, search: str = "", model_id: int = None) -> int:
+        """
+        Посчитать результаты, подходящие под фильтр, не читая сами строки.
+
+        Args:
+            search: Строка поиска.
+            model_id: Фильтр по модели.
+
+        Returns:
+            Количество результатов.
+        """
+        where, params = self._results_filter(search, model_id)
+        query = f"SELECT COUNT(*) FROM results WHERE {where}"
+        return self._execute_plain(query, tuple(params)).fetchone()[0]
+
+    def get_result_previews(
+        self,
+        search: str = "",
+        model_id: int = None,
+        limit: int = 100,
+        offset: int = 0,
+        length: int = 100,
+    ) -> list[dict]:
+        """
+        Получить результаты с укороченными промптом и ответом.
+
+        Обрезка выполняется в SQL, поэтому полные тексты не передаются
+        в Python. Полную запись можно получить через get_result_by_id.
+
+        Args:
+            search: Строка поиска.
+            model_id: Фильтр по модели.
+            limit: Максимальное количество записей.
+            offset: Смещение.
+            length: Длина превью в символах.
+
+        Returns:
+            Список словарей с полями id, model_id, model_name, tokens,
+            created_at, preview_prompt и preview_response.
+        """
+        where, filter_params = self._results_filter(search, model_id)
+        query = f"""
+            SELECT id, model_id, model_name, tokens, created_at,
+                   SUBSTR(prompt_text, 1, ?)
+                       || CASE WHEN LENGTH(prompt_text) > ? THEN '...' ELSE '' END
+                       AS preview_prompt,
+                   SUBSTR(response, 1, ?)
+                       || CASE WHEN LENGTH(response) > ? THEN '...' ELSE '' END
+                       AS preview_response
+            FROM results
+            WHERE {where}
+            ORDER BY created_at DESC
+            LIMIT ? OFFSET ?
+        """
+        params = [length, length, length, length, *filter_params, limit, offset]
+        cursor = self.connection.execute(query, params)
+        return [dict(row) for row in cursor.fetchall()]
+
+    def _results_filter(self, search: str, model_id: Optional[int]) -> tuple[str, list]:
+        """
+        Построить условие WHERE для выборки результатов.
+
+        Returns:
+            Кортеж (условие, параметры).
+        """
+        where = "1=1"
         params = []
 
-        if search:
-            query += " AND (prompt_text LIKE ? OR response LIKE ? OR model_name LIKE ?)"
+        if search and self._use_fts(search):
+            where += self._SQL_RESULTS_FTS
+            params.append(self._fts_query(search))
+        elif search:
+            where += self._SQL_RESULTS_LIKE
             params.extend([f"%{search}%", f"%{search}%", f"%{search}%"])
 
         if model_id:
-            query += " AND model_id = ?"
+            where += self._SQL_RESULTS_MODEL
             params.append(model_id)
 
-        query += " ORDER BY created_at DESC LIMIT ? OFFSET ?"
-        params.extend([limit, offset])
-
-        cursor.execute(query, params)
-        return [dict(row) for row in cursor.fetchall()]
+        return where, params
 
     def get_result_by_id(self, result_id: int) -> Optional[dict]:
         """Получить результат по ID."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT * FROM results WHERE id = ?", (result_id,))
-        row = cursor.fetchone()
+        row = self.connection.execute(self._SQL_GET_RESULT, (result_id,)).fetchone()
         return dict(row) if row else None
 
+    def update_result(
+        self, result_id: int, model_name: str, prompt_text: str, response: str
+    ) -> bool:
+        """Обновить название модели, промпт и ответ результата."""
+        return self.update_results([(model_name, prompt_text, response, result_id)]) > 0
+
+    def update_results(self, updates: list[tuple]) -> int:
+        """
+        Обновить несколько результатов одной транзакцией.
+
+        Args:
+            updates: Кортежи (model_name, prompt_text, response, id).
+
+        Returns:
+            Количество изменённых записей.
+        """
+        if not updates:
+            return 0
+        with self.connection:
+            cursor = self.connection.executemany(
+                "UPDATE results SET model_name = ?, prompt_text = ?, response = ? WHERE id = ?",
+                updates,
+            )
+        return cursor.rowcount
+
     def delete_result(self, result_id: int) -> bool:
         """Удалить результат."""
-        cursor = self.connection.cursor()
-        cursor.execute("DELETE FROM results WHERE id = ?", (result_id,))
+        cursor = self.connection.execute("DELETE FROM results WHERE id = ?", (result_id,))
         self.connection.commit()
         return cursor.rowcount > 0
 
@@ -412,35 +783,46 @@ class Database:
         Returns:
             Значение настройки или default.
         """
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
-        row = cursor.fetchone()
-        return row["value"] if row else default
+        now = time.monotonic()
+        cached = self._settings_cache.get(key)
+        if cached is not None and now - cached[0] < SETTINGS_TTL:
+            value = cached[1]
+        else:
+            row = self._execute_plain(self._SQL_GET_SETTING, (key,)).fetchone()
+            value = row[0] if row else None
+            self._settings_cache[key] = (now, value)
+        return value if value is not None else default
 
-    def set_setting(self, key: str, value: str) -> None:
+    def get_int_setting(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """
+        Получить числовое значение настройки.
+
+        Args:
+            key: Ключ настройки.
+            default: Значение по умолчанию.
+
+        Returns:
+            Значение настройки или default.
+        """
+        value = self.get_setting(key)
+        return int(value) if value is not None else default
+
+    def set_setting(self, key: str, value: Any) -> None:
         """
         Установить значение настройки.
 
+        Колонка value имеет тип TEXT, поэтому числа SQLite сам сохраняет
+        строкой — преобразовывать их заранее не нужно.
+
         Args:
             key: Ключ настройки.
             value: Значение настройки.
         """
-        cursor = self.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO settings (key, value, updated_at) 
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(key) DO UPDATE SET 
-                value = excluded.value,
-                updated_at = CURRENT_TIMESTAMP
-            """,
-            (key, value),
-        )
+        self.connection.execute(self._SQL_SET_SETTING, (key, value))
         self.connection.commit()
+        self._settings_cache.pop(key, None)
 
     def get_all_settings(self) -> dict[str, str]:
         """Получить все настройки."""
-        cursor = self.connection.cursor()
-        cursor.execute("SELECT key, value FROM settings")
-        return {row["key"]: row["value"] for row in cursor.fetchall()}
+        return dict(self._execute_plain("SELECT key, value FROM settings").fetchall())
 
@@ -0,0 +1,60 @@
+"""
+Модуль экспорта результатов в файлы Markdown и JSON.
+"""
+
+import json
+from typing import Iterable
+
+# Размер буфера файла экспорта, байты
+EXPORT_BUFFER_SIZE = 1 << 20
+
+
+def write_markdown(file_path: str, rows: Iterable[dict], labels: dict) -> None:
+    """
+    Записать результаты в файл Markdown.
+
+    Args:
+        file_path: Путь к файлу.
+        rows: Результаты в виде словарей (например, из Database.iter_results).
+        labels: Переведённые подписи (header, prompt, response).
+    """
+    prompt_label = labels["prompt"]
+    response_label = labels["response"]
+
+    # Записи читаются из курсора порциями и пишутся пачками по 100:
+    # в памяти одновременно не больше одной пачки ответов
+    parts = [f"{labels['header']}\n\n"]
+    parts_append = parts.append
+    with open(file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+        for r in rows:
+            parts_append(
+                f"## {r['model_name']} — {r['created_at']}\n\n"
+                f"{prompt_label} {r['prompt_text']}\n\n"
+                f"{response_label}\n\n{r['response']}\n\n---\n\n"
+            )
+            if len(parts) >= 100:
+                f.write("".join(parts))
+                parts.clear()
+        f.write("".join(parts))
+
+
+def write_json(file_path: str, rows: Iterable[dict]) -> None:
+    """
+    Записать результаты в файл JSON.
+
+    Массив пишется по одной записи прямо из курсора; вывод совпадает
+    с json.dumps(list(rows), ensure_ascii=False, indent=2), в том числе
+    "[]" для пустой выборки.
+
+    Args:
+        file_path: Путь к файлу.
+        rows: Результаты в виде словарей (например, из Database.iter_results).
+    """
+    separator = "[\n  "
+    with open(file_path, "w", encoding="utf-8", buffering=EXPORT_BUFFER_SIZE) as f:
+        for r in rows:
+            item = json.dumps(r, ensure_ascii=False, indent=2)
+            f.write(separator + item.replace("\n", "\n  "))
+            separator = ",\n  "
+        # Пока separator не сменился, ни одной записи не было
+        f.write("[]" if separator == "[\n  " else "\n]")
@@ -2,12 +2,28 @@
 Модуль логирования запросов.
 """
 
+import atexit
 import logging
-from datetime import datetime
+import logging.handlers
+import queue
 from pathlib import Path
+from typing import Optional
 from version import __version__
 
 
+# Фоновый поток записи логов
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+@atexit.register
+def _stop_listener() -> None:
+    """Остановить фоновый поток, дописав все записи из очереди."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 def setup_logger(log_dir: str = "logs") -> logging.Logger:
     """
     Настроить логгер для приложения.
@@ -18,11 +34,15 @@ def setup_logger(log_dir: str = "logs") -> logging.Logger:
     Returns:
         Настроенный логгер.
     """
+    global _listener
+
     # Создать директорию для логов
     log_path = Path(log_dir)
     log_path.mkdir(exist_ok=True)
 
-    # Имя файла с датой
+    # Имя файла с датой (datetime нужен только при настройке логгера)
+    from datetime import datetime
+
     log_file = log_path / f"chatlist_{datetime.now().strftime('%Y-%m-%d')}.log"
 
     # Настройка логгера
@@ -39,26 +59,49 @@ def setup_logger(log_dir: str = "logs") -> logging.Logger:
     )
 
     # Файловый обработчик
-    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     file_handler.setLevel(logging.DEBUG)
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
     # Консольный обработчик
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+
+    # Вызовы логгера только кладут запись в очередь, а запись в файл
+    # и консоль выполняет фоновый поток QueueListener
+    log_queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    _stop_listener()
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _listener.start()
 
     return logger
 
 
-# Глобальный логгер
-logger = setup_logger()
+# Глобальный логгер (создаётся при первом обращении)
+_logger: Optional[logging.Logger] = None
+
+
+def get_logger() -> logging.Logger:
+    """
+    Получить логгер приложения, настроив его при первом вызове.
+
+    Returns:
+        Настроенный логгер.
+    """
+    global _logger
+    if _logger is None:
+        _logger = setup_logger()
+    return _logger
 
 
 def log_request(prompt: str, models: list) -> None:
     """Логировать отправку запроса."""
+    logger = get_logger()
     model_names = [m.get("name", "Unknown") for m in models]
     logger.info(f"Отправка запроса в {len(models)} моделей: {', '.join(model_names)}")
     logger.debug(f"Промпт: {prompt[:200]}{'...' if len(prompt) > 200 else ''}")
@@ -66,24 +109,42 @@ def log_request(prompt: str, models: list) -> None:
 
 def log_response(model_name: str, success: bool, tokens: int = 0, error: str = None) -> None:
     """Логировать ответ от модели."""
+    logger = get_logger()
     if success:
         logger.info(f"✓ {model_name}: получен ответ ({tokens} токенов)")
     else:
         logger.warning(f"✗ {model_name}: ошибка — {error}")
 
 
+def log_responses(results: list) -> None:
+    """Логировать ответы всех моделей одной записью."""
+    lines = []
+    failed = False
+    for r in results:
+        name = r.get("model_name", "Unknown")
+        if r.get("success", False):
+            lines.append(f"✓ {name}: получен ответ ({r.get('tokens', 0)} токенов)")
+        else:
+            failed = True
+            lines.append(f"✗ {name}: ошибка — {r.get('error')}")
+    if lines:
+        level = logging.WARNING if failed else logging.INFO
+        get_logger().log(level, f"Ответы {len(lines)} моделей:\n" + "\n".join(lines))
+
+
 def log_save_results(count: int) -> None:
     """Логировать сохранение результатов."""
-    logger.info(f"Сохранено {count} результатов в базу данных")
+    get_logger().info(f"Сохранено {count} результатов в базу данных")
 
 
 def log_export(file_path: str, format_type: str) -> None:
     """Логировать экспорт данных."""
-    logger.info(f"Экспорт в {format_type}: {file_path}")
+    get_logger().info(f"Экспорт в {format_type}: {file_path}")
 
 
 def log_error(message: str, exception: Exception = None) -> None:
     """Логировать ошибку."""
+    logger = get_logger()
     if exception:
         logger.error(f"{message}: {exception}", exc_info=True)
     else:
@@ -92,6 +153,7 @@ def log_error(message: str, exception: Exception = None) -> None:
 
 def log_app_start() -> None:
     """Логировать запуск приложения."""
+    logger = get_logger()
     logger.info("=" * 50)
     logger.info(f"ChatList v{__version__} запущен")
     logger.info("=" * 50)
@@ -99,6 +161,7 @@ def log_app_start() -> None:
 
 def log_app_close() -> None:
     """Логировать закрытие приложения."""
+    logger = get_logger()
     logger.info("ChatList закрыт")
     logger.info("=" * 50)
 
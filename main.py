@@ -2,7 +2,13 @@
 ChatList — приложение для сравнения ответов нейросетей.
 """
 
+import hashlib
+import os
 import sys
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional
 from PyQt5.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -14,10 +20,9 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QPushButton,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
     QHeaderView,
-    QCheckBox,
     QComboBox,
     QMessageBox,
     QProgressBar,
@@ -27,9 +32,27 @@ from PyQt5.QtWidgets import (
     QFileDialog,
     QDialog,
     QTextBrowser,
+    QStyledItemDelegate,
+    QStyleOptionButton,
+    QStyle,
 )
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import (
+    Qt,
+    QEvent,
+    QThread,
+    QTimer,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    pyqtSignal,
+    pyqtSlot,
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    QMimeData,
+    QByteArray,
+)
+from PyQt5.QtGui import QFont, QIcon, QBrush, QColor, QTextDocument
 
 TRANSLATIONS = {
     "ru": {
@@ -48,6 +71,7 @@ TRANSLATIONS = {
         "dialog_copy": "📋 Копировать",
         "dialog_close": "Закрыть",
         "dialog_copied": "Текст скопирован в буфер обмена",
+        "dialog_rendering": "Отрисовка…",
         "prompt_improver_title": "✨ Улучшение промпта",
         "prompt_dialog_title": "Промпт",
         "prompt_original_label": "📝 Оригинальный промпт:",
@@ -88,6 +112,8 @@ TRANSLATIONS = {
         "results_table_model": "Модель",
         "results_table_response": "Ответ",
         "results_table_tokens": "Токены",
+        "results_table_open": "",
+        "results_open_btn": "📖 Открыть",
         "results_save_btn": "💾 Сохранить выбранные",
         "results_clear_btn": "🗑 Очистить",
         "results_error_no_selection": "Не выбрано ни одного результата",
@@ -214,6 +240,7 @@ TRANSLATIONS = {
         "dialog_copy": "📋 Kopiraj",
         "dialog_close": "Zatvori",
         "dialog_copied": "Tekst je kopiran u međuspremnik",
+        "dialog_rendering": "Prikazivanje…",
         "prompt_improver_title": "✨ Unapređenje upita",
         "prompt_dialog_title": "Upit",
         "prompt_original_label": "📝 Originalni upit:",
@@ -254,6 +281,8 @@ TRANSLATIONS = {
         "results_table_model": "Model",
         "results_table_response": "Odgovor",
         "results_table_tokens": "Tokeni",
+        "results_table_open": "",
+        "results_open_btn": "📖 Otvori",
         "results_save_btn": "💾 Sačuvaj izabrane",
         "results_clear_btn": "🗑 Očisti",
         "results_error_no_selection": "Nijedan rezultat nije izabran",
@@ -384,78 +413,260 @@ class I18n:
         return template.format(**kwargs)
 
 
+# Общие стили кнопок, заголовков вкладок, разделителей и просмотра Markdown.
+# Виджеты выбирают стиль через objectName (цвет) и свойство size (размер);
+# строка добавляется к теме главного окна и разбирается один раз на тему.
+APP_QSS = """
+    QPushButton#primary, QPushButton#danger, QPushButton#success,
+    QPushButton#accent, QPushButton#muted {
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton#primary { background-color: #3498db; }
+    QPushButton#primary:hover { background-color: #2980b9; }
+    QPushButton#danger { background-color: #e74c3c; }
+    QPushButton#danger:hover { background-color: #c0392b; }
+    QPushButton#success { background-color: #27ae60; }
+    QPushButton#success:hover { background-color: #219a52; }
+    QPushButton#accent { background-color: #9b59b6; }
+    QPushButton#accent:hover { background-color: #8e44ad; }
+    QPushButton#muted { background-color: #95a5a6; }
+    QPushButton#muted:hover { background-color: #7f8c8d; }
+    QPushButton#primary:disabled, QPushButton#success:disabled {
+        background-color: #bdc3c7;
+    }
+    QPushButton[size="large"] {
+        padding: 10px 20px;
+        border-radius: 5px;
+        font-size: 14px;
+    }
+    QPushButton[size="hero"] {
+        padding: 12px 28px;
+        border-radius: 5px;
+        font-size: 15px;
+        font-weight: bold;
+    }
+    QLabel#title {
+        font-size: 18px;
+        font-weight: bold;
+    }
+    QLabel#heading {
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QLabel#sectionTitle {
+        font-size: 16px;
+        font-weight: bold;
+    }
+    QLabel[tone="muted"] { color: #7f8c8d; }
+    QLabel[tone="primary"] { color: #3498db; }
+    QLabel[tone="success"] { color: #27ae60; }
+    QLabel[tone="accent"] { color: #9b59b6; }
+    QLabel#hint { font-style: italic; }
+    QLabel#altTitle {
+        font-weight: bold;
+        color: #2980b9;
+    }
+    QTextEdit#original {
+        background-color: #f8f9fa;
+        border: 1px solid #dee2e6;
+        border-radius: 5px;
+        padding: 8px;
+        color: #6c757d;
+    }
+    QFrame#improvedCard {
+        background-color: #e8f5e9;
+        border: 2px solid #27ae60;
+        border-radius: 8px;
+    }
+    QFrame#altCard {
+        background-color: #e3f2fd;
+        border: 1px solid #3498db;
+        border-radius: 5px;
+    }
+    QTextEdit#bare {
+        background-color: transparent;
+        border: none;
+    }
+    QFrame#improvedCard QTextEdit#bare { padding: 5px; }
+    QLabel#appName {
+        font-size: 24px;
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    QLabel#version {
+        font-size: 14px;
+        color: #7f8c8d;
+    }
+    QLabel#description {
+        font-size: 13px;
+        color: #34495e;
+    }
+    QLabel#author {
+        font-size: 12px;
+        color: #95a5a6;
+    }
+    QLabel#link { font-size: 12px; }
+    QFrame#separator {
+        background-color: #dee2e6;
+    }
+    QTextBrowser#md {
+        background-color: #ffffff;
+        border: 1px solid #dee2e6;
+        border-radius: 5px;
+        padding: 15px;
+        font-size: 14px;
+        line-height: 1.6;
+    }
+"""
+
+
+# Сколько отрисованных документов хранить: ключ — хэш текста, поэтому
+# в памяти остаётся только HTML, а не исходные ответы
+MARKDOWN_CACHE_SIZE = 16
+
+_markdown_cache: OrderedDict = OrderedDict()
+_markdown_cache_lock = threading.Lock()  # кэш читают GUI-поток и пул
+
+
+def _markdown_key(text: str, font: str) -> tuple:
+    """Ключ кэша HTML: хэш текста и шрифт."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest(), font
+
+
+def cached_markdown(text: str, font: str) -> Optional[str]:
+    """Получить уже отрисованный HTML или None."""
+    key = _markdown_key(text, font)
+    with _markdown_cache_lock:
+        html = _markdown_cache.get(key)
+        if html is not None:
+            _markdown_cache.move_to_end(key)
+        return html
+
+
+def render_markdown(text: str, font: str) -> str:
+    """
+    Преобразовать Markdown в HTML один раз для каждого текста.
+
+    Args:
+        text: Текст в формате Markdown.
+        font: Шрифт браузера (QFont.toString()): он попадает в стиль HTML.
+
+    Returns:
+        HTML-документ для QTextBrowser.setHtml.
+    """
+    html = cached_markdown(text, font)
+    if html is not None:
+        return html
+    document = QTextDocument()
+    default_font = QFont()
+    default_font.fromString(font)
+    document.setDefaultFont(default_font)
+    document.setMarkdown(text)
+    html = document.toHtml()
+    with _markdown_cache_lock:
+        _markdown_cache[_markdown_key(text, font)] = html
+        if len(_markdown_cache) > MARKDOWN_CACHE_SIZE:
+            _markdown_cache.popitem(last=False)
+    return html
+
+
+class MarkdownRenderSignals(QObject):
+    """Сигналы задачи отрисовки Markdown."""
+
+    done = pyqtSignal(str, str)  # исходный текст, HTML
+
+
+class MarkdownRenderRunnable(QRunnable):
+    """Задача пула потоков: разбор Markdown вне GUI-потока."""
+
+    def __init__(self, text: str, font: str):
+        super().__init__()
+        self.signals = MarkdownRenderSignals()
+        self.text = text
+        self.font = font
+
+    def run(self):
+        self.signals.done.emit(self.text, render_markdown(self.text, self.font))
+
+
 class MarkdownViewerDialog(QDialog):
     """Диалог для просмотра ответа в формате Markdown."""
 
     def __init__(self, title: str, content: str, i18n: I18n, parent=None):
         super().__init__(parent)
         self.i18n = i18n
-        self.setWindowTitle(self.i18n.t("dialog_response_title", title=title))
+        self.content = ""
         self.setMinimumSize(800, 600)
-        self.setup_ui(content)
+        self.setup_ui()
+        self.set_content(title, content)
 
-    def setup_ui(self, content: str):
+    def setup_ui(self):
         layout = QVBoxLayout(self)
 
         # Текстовый браузер с поддержкой Markdown
         self.text_browser = QTextBrowser()
         self.text_browser.setOpenExternalLinks(True)
-        self.text_browser.setMarkdown(content)
-        self.text_browser.setStyleSheet("""
-            QTextBrowser {
-                background-color: #ffffff;
-                border: 1px solid #dee2e6;
-                border-radius: 5px;
-                padding: 15px;
-                font-size: 14px;
-                line-height: 1.6;
-            }
-        """)
+        self.text_browser.setObjectName("md")
         layout.addWidget(self.text_browser)
 
         # Кнопки
         buttons_layout = QHBoxLayout()
 
-        copy_btn = QPushButton(self.i18n.t("dialog_copy"))
-        copy_btn.clicked.connect(lambda: self.copy_to_clipboard(content))
-        copy_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
-        buttons_layout.addWidget(copy_btn)
+        self.copy_btn = QPushButton()
+        self.copy_btn.clicked.connect(self.copy_to_clipboard)
+        self.copy_btn.setObjectName("primary")
+        buttons_layout.addWidget(self.copy_btn)
 
         buttons_layout.addStretch()
 
-        close_btn = QPushButton(self.i18n.t("dialog_close"))
-        close_btn.clicked.connect(self.close)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
-        buttons_layout.addWidget(close_btn)
+        self.close_btn = QPushButton()
+        self.close_btn.clicked.connect(self.close)
+        self.close_btn.setObjectName("muted")
+        buttons_layout.addWidget(self.close_btn)
 
         layout.addLayout(buttons_layout)
 
-    def copy_to_clipboard(self, content: str):
+    def set_content(self, title: str, content: str):
+        """Показать в диалоге новый документ (диалог переиспользуется)."""
+        self.content = content
+        self.setWindowTitle(self.i18n.t("dialog_response_title", title=title))
+        self.copy_btn.setText(self.i18n.t("dialog_copy"))
+        self.close_btn.setText(self.i18n.t("dialog_close"))
+        self.render_content()
+
+    def render_content(self):
+        """
+        Запустить разбор текущего документа в пуле потоков.
+
+        Пока большой ответ разбирается, окно уже показано с заглушкой
+        и не блокирует цикл событий; уже отрисованный документ
+        показывается сразу из кэша, без заглушки и фоновой задачи.
+        """
+        font = self.text_browser.document().defaultFont().toString()
+        html = cached_markdown(self.content, font)
+        if html is not None:
+            self.text_browser.setHtml(html)
+            return
+        self.text_browser.setPlainText(self.i18n.t("dialog_rendering"))
+        job = MarkdownRenderRunnable(self.content, font)
+        job.signals.done.connect(self.on_rendered)
+        QThreadPool.globalInstance().start(job)
+
+    def on_rendered(self, text: str, html: str):
+        """Показать готовый HTML, если документ за это время не сменился."""
+        if text == self.content:
+            self.text_browser.setHtml(html)
+
+    def copy_to_clipboard(self):
         """Копировать содержимое в буфер обмена."""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(content)
+        # Текст кладётся готовыми байтами UTF-8 (так text/plain хранит и
+        # читает QMimeData), без промежуточной копии в QString
+        mime = QMimeData()
+        mime.setData("text/plain", QByteArray(self.content.encode("utf-8")))
+        QApplication.clipboard().setMimeData(mime)
         QMessageBox.information(
             self,
             self.i18n.t("done_title"),
@@ -463,6 +674,30 @@ class MarkdownViewerDialog(QDialog):
         )
 
 
+def open_markdown_viewer(
+    viewer: Optional[MarkdownViewerDialog], title: str, content: str, i18n: I18n, parent
+) -> MarkdownViewerDialog:
+    """
+    Показать документ в диалоге просмотра, создав диалог только при первом вызове.
+
+    Args:
+        viewer: Ранее созданный диалог владельца или None.
+        title: Заголовок документа.
+        content: Текст в формате Markdown.
+        i18n: Переводчик.
+        parent: Родительский виджет.
+
+    Returns:
+        Диалог, который владелец сохраняет для следующих вызовов.
+    """
+    if viewer is None:
+        viewer = MarkdownViewerDialog(title, content, i18n, parent)
+    else:
+        viewer.set_content(title, content)
+    viewer.exec_()
+    return viewer
+
+
 class PromptImproverDialog(QDialog):
     """Диалог для выбора улучшенного промпта."""
 
@@ -482,65 +717,38 @@ class PromptImproverDialog(QDialog):
 
         # Оригинальный промпт
         orig_label = QLabel(self.i18n.t("prompt_original_label"))
-        orig_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #7f8c8d;")
+        orig_label.setObjectName("heading")
+        orig_label.setProperty("tone", "muted")
         layout.addWidget(orig_label)
 
         self.orig_text = QTextEdit()
         self.orig_text.setPlainText(self.result.original)
         self.orig_text.setReadOnly(True)
         self.orig_text.setMaximumHeight(80)
-        self.orig_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 5px;
-                padding: 8px;
-                color: #6c757d;
-            }
-        """)
+        self.orig_text.setObjectName("original")
         layout.addWidget(self.orig_text)
 
         # Улучшенный промпт
         improved_label = QLabel(self.i18n.t("prompt_improved_label"))
-        improved_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #27ae60;")
+        improved_label.setObjectName("heading")
+        improved_label.setProperty("tone", "success")
         layout.addWidget(improved_label)
 
         improved_frame = QFrame()
-        improved_frame.setStyleSheet("""
-            QFrame {
-                background-color: #e8f5e9;
-                border: 2px solid #27ae60;
-                border-radius: 8px;
-            }
-        """)
+        improved_frame.setObjectName("improvedCard")
         improved_layout = QVBoxLayout(improved_frame)
 
         self.improved_text = QTextEdit()
         self.improved_text.setPlainText(self.result.improved)
         self.improved_text.setReadOnly(True)
         self.improved_text.setMinimumHeight(100)
-        self.improved_text.setStyleSheet("""
-            QTextEdit {
-                background-color: transparent;
-                border: none;
-                padding: 5px;
-            }
-        """)
+        self.improved_text.setObjectName("bare")
         improved_layout.addWidget(self.improved_text)
 
         use_improved_btn = QPushButton(self.i18n.t("prompt_use_improved"))
         use_improved_btn.clicked.connect(lambda: self.select_prompt(self.result.improved))
-        use_improved_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover { background-color: #219a52; }
-        """)
+        use_improved_btn.setObjectName("success")
+        use_improved_btn.setProperty("size", "large")
         improved_layout.addWidget(use_improved_btn)
 
         layout.addWidget(improved_frame)
@@ -548,50 +756,33 @@ class PromptImproverDialog(QDialog):
         # Альтернативы
         if self.result.alternatives:
             alt_label = QLabel(self.i18n.t("prompt_alt_label"))
-            alt_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #3498db;")
+            alt_label.setObjectName("heading")
+            alt_label.setProperty("tone", "primary")
             layout.addWidget(alt_label)
 
             for i, alt in enumerate(self.result.alternatives):
                 alt_frame = QFrame()
-                alt_frame.setStyleSheet("""
-                    QFrame {
-                        background-color: #e3f2fd;
-                        border: 1px solid #3498db;
-                        border-radius: 5px;
-                    }
-                """)
+                alt_frame.setObjectName("altCard")
                 alt_layout = QVBoxLayout(alt_frame)
 
                 alt_title = QLabel(self.i18n.t("prompt_alt_title", index=i + 1))
-                alt_title.setStyleSheet("font-weight: bold; color: #2980b9;")
+                alt_title.setObjectName("altTitle")
                 alt_layout.addWidget(alt_title)
 
                 alt_text = QTextEdit()
                 alt_text.setPlainText(alt)
                 alt_text.setReadOnly(True)
                 alt_text.setMaximumHeight(80)
-                alt_text.setStyleSheet("""
-                    QTextEdit {
-                        background-color: transparent;
-                        border: none;
-                    }
-                """)
+                alt_text.setObjectName("bare")
                 alt_layout.addWidget(alt_text)
 
                 use_alt_btn = QPushButton(
                     self.i18n.t("prompt_use_alt", index=i + 1)
                 )
-                use_alt_btn.clicked.connect(lambda checked, text=alt: self.select_prompt(text))
-                use_alt_btn.setStyleSheet("""
-                    QPushButton {
-                        background-color: #3498db;
-                        color: white;
-                        border: none;
-                        padding: 8px 15px;
-                        border-radius: 4px;
-                    }
-                    QPushButton:hover { background-color: #2980b9; }
-                """)
+                # Текст хранится на кнопке: один слот вместо замыкания на каждую
+                use_alt_btn.setProperty("prompt", alt)
+                use_alt_btn.clicked.connect(self.select_sender_prompt)
+                use_alt_btn.setObjectName("primary")
                 alt_layout.addWidget(use_alt_btn)
 
                 layout.addWidget(alt_frame)
@@ -599,16 +790,8 @@ class PromptImproverDialog(QDialog):
         # Кнопка закрытия
         close_btn = QPushButton(self.i18n.t("prompt_close"))
         close_btn.clicked.connect(self.reject)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover { background-color: #7f8c8d; }
-        """)
+        close_btn.setObjectName("muted")
+        close_btn.setProperty("size", "large")
         layout.addWidget(close_btn)
 
     def select_prompt(self, text: str):
@@ -616,14 +799,19 @@ class PromptImproverDialog(QDialog):
         self.prompt_selected.emit(text)
         self.accept()
 
+    def select_sender_prompt(self):
+        """Выбрать промпт, сохранённый на нажатой кнопке."""
+        self.select_prompt(self.sender().property("prompt"))
+
 
 from db import Database
+from export import write_json, write_markdown
 from models import ModelManager, ResultsStore, PromptImprover, ImprovedPrompt
 from network import send_to_models_sync
 from version import __version__
 from logger import (
     log_request,
-    log_response,
+    log_responses,
     log_save_results,
     log_export,
     log_error,
@@ -632,14 +820,373 @@ from logger import (
 )
 
 
-class RequestWorker(QThread):
-    """Поток для отправки запросов к API."""
+# Сколько символов ответа показывается в таблице результатов
+RESULT_PREVIEW_LENGTH = 1000
+# Предел длины всплывающей подсказки с полным текстом ячейки
+TOOLTIP_LENGTH = 4000
+
+
+def truncate(text: str, length: int) -> str:
+    """Обрезать текст до length символов с многоточием."""
+    return text[:length] + "..." if len(text) > length else text
+
+
+@contextmanager
+def bulk_update(view: QTableView):
+    """
+    Отключить сортировку и перерисовку таблицы на время массового обновления.
+
+    Сортировка и отрисовка выполняются один раз после выхода из блока,
+    а не на каждую изменённую строку.
+
+    Args:
+        view: Обновляемая таблица.
+    """
+    sorting = view.isSortingEnabled()
+    view.setSortingEnabled(False)
+    view.setUpdatesEnabled(False)
+    try:
+        yield
+    finally:
+        view.setSortingEnabled(sorting)
+        view.setUpdatesEnabled(True)
+
+
+def enable_sorting_on_demand(view: QTableView) -> None:
+    """
+    Включить сортировку таблицы только после первого щелчка по заголовку.
+
+    До этого прокси-модель не сортирует строки при каждом обновлении.
+
+    Args:
+        view: Таблица с моделью за QSortFilterProxyModel.
+    """
+    header = view.horizontalHeader()
+    header.setSectionsClickable(True)
+
+    def on_section_clicked(section: int):
+        header.sectionClicked.disconnect(on_section_clicked)
+        header.setSortIndicator(section, Qt.AscendingOrder)
+        view.setSortingEnabled(True)
+
+    header.sectionClicked.connect(on_section_clicked)
+
+
+def selected_source_row(view: QTableView) -> int:
+    """
+    Получить индекс выбранной строки в исходной модели таблицы.
+
+    Args:
+        view: Таблица (модель может быть обёрнута в QSortFilterProxyModel).
+
+    Returns:
+        Номер строки в исходной модели или -1, если ничего не выбрано.
+    """
+    rows = view.selectionModel().selectedRows()
+    if not rows:
+        return -1
+    index = rows[0]
+    model = view.model()
+    if isinstance(model, QSortFilterProxyModel):
+        index = model.mapToSource(index)
+    return index.row()
+
+
+class BaseTableModel(QAbstractTableModel):
+    """Базовая модель таблицы над списком строк с переводимыми заголовками."""
+
+    def __init__(self, i18n: I18n, header_keys: list[str], parent=None):
+        super().__init__(parent)
+        self.i18n = i18n
+        self.header_keys = header_keys
+        self._rows: list = []
+
+    @property
+    def rows(self) -> list:
+        """Получить строки модели."""
+        return self._rows
+
+    def set_rows(self, rows: list) -> None:
+        """Заменить все строки модели."""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def row_at(self, row: int):
+        """Получить строку по индексу или None."""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]
+        return None
+
+    def remove_row(self, row: int) -> None:
+        """Удалить одну строку, не сбрасывая всю модель."""
+        if 0 <= row < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            del self._rows[row]
+            self.endRemoveRows()
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.header_keys)
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.i18n.t(self.header_keys[section])
+        return super().headerData(section, orientation, role)
+
+    def refresh_column(self, column: int, roles: Optional[list] = None) -> None:
+        """Сообщить представлению об изменении одного столбца во всех строках."""
+        if not self._rows:
+            return
+        self.dataChanged.emit(
+            self.index(0, column),
+            self.index(len(self._rows) - 1, column),
+            roles or [],
+        )
+
+    def retranslate(self) -> None:
+        """Обновить заголовки после смены языка."""
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self.header_keys) - 1)
+
+
+class ResultsTableModel(BaseTableModel):
+    """Модель таблицы временных результатов (TempResult)."""
+
+    # Общие значения ролей: не создаются заново при каждом вызове data()
+    FAILED_BRUSH = QBrush(QColor("#e74c3c"))  # цвет кнопок «danger»
+    RESPONSE_ALIGNMENT = int(Qt.AlignTop | Qt.AlignLeft)
+
+    def __init__(self, i18n: I18n, parent=None):
+        super().__init__(
+            i18n,
+            [
+                "results_table_select",
+                "results_table_model",
+                "results_table_response",
+                "results_table_tokens",
+                "results_table_open",
+            ],
+            parent,
+        )
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        result = self._rows[index.row()]
+        column = index.column()
+
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if result.selected else Qt.Unchecked
+        elif column == 1:
+            if role == Qt.DisplayRole:
+                return result.model_name
+            if role == Qt.ForegroundRole and not result.success:
+                return self.FAILED_BRUSH
+        elif column == 2:
+            if role == Qt.DisplayRole:
+                return result.preview
+            if role == Qt.ToolTipRole:
+                return truncate(result.response, TOOLTIP_LENGTH)
+            if role == Qt.TextAlignmentRole:
+                return self.RESPONSE_ALIGNMENT
+        elif column == 3:
+            if role == Qt.DisplayRole:
+                return result.tokens
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        result = self._rows[index.row()]
+        checked = value == Qt.Checked
+        if result.selected != checked:
+            result.selected = checked
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+        return True
+
+    def flags(self, index: QModelIndex):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+
+class ActionButtonDelegate(QStyledItemDelegate):
+    """
+    Делегат, рисующий кнопку в ячейке столбца.
+
+    Одна кнопка рисуется через стиль приложения для всех строк вместо
+    отдельного QPushButton на каждую строку.
+    """
+
+    clicked = pyqtSignal(int)  # строка исходной модели
+
+    def __init__(self, i18n: I18n, text_key: str, parent=None):
+        """
+        Args:
+            i18n: Переводчик для подписи кнопки.
+            text_key: Ключ перевода подписи.
+        """
+        super().__init__(parent)
+        self.i18n = i18n
+        self.text_key = text_key
+
+    def paint(self, painter, option, index):
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(4, 4, -4, -4)
+        button.text = self.i18n.t(self.text_key)
+        button.state = QStyle.State_Enabled
+        QApplication.style().drawControl(QStyle.CE_PushButton, button, painter)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (
+            event.type() == QEvent.MouseButtonRelease
+            and event.button() == Qt.LeftButton
+            and option.rect.contains(event.pos())
+        ):
+            if isinstance(model, QSortFilterProxyModel):
+                index = model.mapToSource(index)
+            self.clicked.emit(index.row())
+            return True
+        return False
+
+
+class ModelsTableModel(BaseTableModel):
+    """Модель таблицы нейросетей (словари из базы данных)."""
+
+    active_toggled = pyqtSignal(int)  # id модели
+
+    FIELDS = ("name", "provider", "api_url", "api_key_env", "model_id")
+
+    def __init__(self, i18n: I18n, parent=None):
+        super().__init__(
+            i18n,
+            [
+                "models_table_active",
+                "models_table_name",
+                "models_table_provider",
+                "models_table_url",
+                "models_table_api_key",
+                "models_table_model_id",
+            ],
+            parent,
+        )
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        model = self._rows[index.row()]
+        column = index.column()
+
+        if column == 0:
+            if role == Qt.CheckStateRole:
+                return Qt.Checked if model["is_active"] else Qt.Unchecked
+        elif role == Qt.DisplayRole:
+            return model[self.FIELDS[column - 1]]
+        return None
+
+    def setData(self, index: QModelIndex, value, role=Qt.EditRole) -> bool:
+        if not index.isValid() or index.column() != 0 or role != Qt.CheckStateRole:
+            return False
+        model = self._rows[index.row()]
+        is_active = 1 if value == Qt.Checked else 0
+        # toggle_model в базе инвертирует флаг, поэтому повтор того же
+        # состояния не должен доходить до базы
+        if bool(model["is_active"]) != bool(is_active):
+            model["is_active"] = is_active
+            self.dataChanged.emit(index, index, [Qt.CheckStateRole])
+            self.active_toggled.emit(model["id"])
+        return True
+
+    def flags(self, index: QModelIndex):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == 0:
+            flags |= Qt.ItemIsUserCheckable
+        return flags
+
+
+class HistoryTableModel(BaseTableModel):
+    """
+    Модель таблицы сохранённых результатов (страница истории).
+
+    Строки содержат только превью из базы данных; полная запись для
+    подсказки загружается через loader при первом наведении.
+    """
+
+    def __init__(self, i18n: I18n, loader, parent=None):
+        """
+        Args:
+            i18n: Переводчик.
+            loader: Функция (result_id) -> dict с полной записью результата.
+        """
+        self.loader = loader
+        self._full: dict[int, dict] = {}
+        super().__init__(
+            i18n,
+            [
+                "history_table_date",
+                "history_table_model",
+                "history_table_prompt",
+                "history_table_response",
+            ],
+            parent,
+        )
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        result = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return result["created_at"]
+            if column == 1:
+                return result["model_name"]
+            if column == 2:
+                return result["preview_prompt"]
+            if column == 3:
+                return result["preview_response"]
+        elif role == Qt.ToolTipRole and column in (2, 3):
+            full = self.full_record(index.row())
+            if full:
+                text = full["prompt_text"] if column == 2 else full["response"]
+                return truncate(text, TOOLTIP_LENGTH)
+        return None
+
+    def set_rows(self, rows: list) -> None:
+        self._full.clear()
+        super().set_rows(rows)
+
+    def full_record(self, row: int):
+        """Получить полную запись результата для строки (с кэшированием)."""
+        result = self.row_at(row)
+        if result is None:
+            return None
+        result_id = result["id"]
+        if result_id not in self._full:
+            self._full[result_id] = self.loader(result_id)
+        return self._full[result_id]
+
+
+class WorkerSignals(QObject):
+    """Сигналы фоновой задачи (QRunnable сам не может их объявлять)."""
 
-    finished = pyqtSignal(list)
+    finished = pyqtSignal(str, list)  # prompt, results
     error = pyqtSignal(str)
 
+
+class RequestRunnable(QRunnable):
+    """Задача пула потоков для отправки запросов к API."""
+
     def __init__(self, prompt: str, models: list, timeout: int = 60):
         super().__init__()
+        # Временем жизни управляет окно (MainWindow.running_tasks), а не пул
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
         self.prompt = prompt
         self.models = models
         self.timeout = timeout
@@ -647,19 +1194,156 @@ class RequestWorker(QThread):
     def run(self):
         try:
             results = send_to_models_sync(self.prompt, self.models, self.timeout)
-            self.finished.emit(results)
+            # Текст для таблицы готовится здесь, а не при каждой отрисовке
+            for r in results:
+                r["preview"] = truncate(r.get("response", ""), RESULT_PREVIEW_LENGTH)
+            self.signals.finished.emit(self.prompt, results)
+        except Exception as e:
+            self.signals.error.emit(str(e))
+
+
+class DbWorker(QObject):
+    """
+    Выполняет запросы к базе данных в отдельном потоке.
+
+    Объект переносится в QThread и открывает там собственное соединение.
+    Публичные методы можно вызывать из GUI-потока: они ставят запрос
+    в очередь потока, а результат приходит сигналом *_loaded / *_saved /
+    *_updated / exported.
+    """
+
+    prompts_loaded = pyqtSignal(list)
+    history_loaded = pyqtSignal(int, int, int, list)  # request_id, page, total, rows
+    results_saved = pyqtSignal(int)  # количество сохранённых
+    result_updated = pyqtSignal()
+    exported = pyqtSignal(str, str)  # путь, формат
+    error = pyqtSignal(str)
+
+    _prompts_requested = pyqtSignal(int)
+    _history_requested = pyqtSignal(int, str, int, int)
+    _save_requested = pyqtSignal(list)
+    _update_requested = pyqtSignal(int, dict)
+    _export_requested = pyqtSignal(str, str, str, dict)
+
+    def __init__(self, db_path, parent=None):
+        super().__init__(parent)
+        self.db_path = db_path
+        self.db: Optional[Database] = None
+        self._prompts_requested.connect(self._load_prompts)
+        self._history_requested.connect(self._load_history)
+        self._save_requested.connect(self._save_results)
+        self._update_requested.connect(self._update_result)
+        self._export_requested.connect(self._export_results)
+
+    def load_prompts(self, limit: int = 50) -> None:
+        """Запросить превью последних промптов."""
+        self._prompts_requested.emit(limit)
+
+    def load_history(self, request_id: int, search: str, page: int, page_size: int) -> None:
+        """Запросить страницу истории (request_id возвращается в ответе)."""
+        self._history_requested.emit(request_id, search, page, page_size)
+
+    def save_results(self, rows: list) -> None:
+        """Запросить сохранение результатов."""
+        self._save_requested.emit(rows)
+
+    def update_result(self, result_id: int, values: dict) -> None:
+        """Запросить изменение результата (model_name, prompt_text, response)."""
+        self._update_requested.emit(result_id, values)
+
+    def export_results(self, format_type: str, file_path: str, search: str, labels: dict) -> None:
+        """
+        Запросить экспорт результатов поиска в файл.
+
+        Args:
+            format_type: "Markdown" или "JSON".
+            file_path: Путь к файлу.
+            search: Строка поиска.
+            labels: Переведённые подписи Markdown (header, prompt, response).
+        """
+        self._export_requested.emit(format_type, file_path, search, labels)
+
+    def _database(self) -> Database:
+        """Соединение создаётся в потоке воркера при первом запросе."""
+        if self.db is None:
+            self.db = Database(self.db_path)
+        return self.db
+
+    @pyqtSlot(int)
+    def _load_prompts(self, limit: int) -> None:
+        try:
+            self.prompts_loaded.emit(self._database().get_prompt_previews(limit=limit))
         except Exception as e:
             self.error.emit(str(e))
 
+    @pyqtSlot(int, str, int, int)
+    def _load_history(self, request_id: int, search: str, page: int, page_size: int) -> None:
+        try:
+            db = self._database()
+            total = db.count_results(search=search)
+            total_pages = max(1, (total + page_size - 1) // page_size)
+            page = min(page, total_pages)
+            rows = db.get_result_previews(
+                search=search, limit=page_size, offset=(page - 1) * page_size, length=100
+            )
+            self.history_loaded.emit(request_id, page, total, rows)
+        except Exception as e:
+            self.error.emit(str(e))
 
-class ImproveWorker(QThread):
-    """Поток для улучшения промпта через AI."""
+    @pyqtSlot(list)
+    def _save_results(self, rows: list) -> None:
+        try:
+            self._database().save_results(rows)
+            self.results_saved.emit(len(rows))
+        except Exception as e:
+            self.error.emit(str(e))
+
+    @pyqtSlot(int, dict)
+    def _update_result(self, result_id: int, values: dict) -> None:
+        try:
+            self._database().update_result(
+                result_id, values["model_name"], values["prompt_text"], values["response"]
+            )
+            self.result_updated.emit()
+        except Exception as e:
+            self.error.emit(str(e))
+
+    @pyqtSlot(str, str, str, dict)
+    def _export_results(self, format_type: str, file_path: str, search: str, labels: dict) -> None:
+        try:
+            # Строки читаются из курсора пачками, поэтому экспорт не
+            # ограничен по размеру: в памяти только текущая пачка
+            rows = self._database().iter_results(search=search, limit=-1)
+            if format_type == "JSON":
+                write_json(file_path, rows)
+            else:
+                write_markdown(file_path, rows, labels)
+            self.exported.emit(file_path, format_type)
+        except Exception as e:
+            self.error.emit(str(e))
+
+    def close(self) -> None:
+        """Закрыть соединение воркера."""
+        if self.db is not None:
+            self.db.close()
+            self.db = None
+
+
+class ImproveSignals(QObject):
+    """Сигналы задачи улучшения промпта."""
 
     finished = pyqtSignal(object)  # ImprovedPrompt
     error = pyqtSignal(str)
 
+
+class ImproveRunnable(QRunnable):
+    """Задача пула потоков для улучшения промпта через AI."""
+
     def __init__(self, prompt: str, improver: PromptImprover, timeout: int = 90):
         super().__init__()
+        # Временем жизни управляет окно (MainWindow.running_tasks), а не пул
+        self.setAutoDelete(False)
+        self.signals = ImproveSignals()
         self.prompt = prompt
         self.improver = improver
         self.timeout = timeout
@@ -667,9 +1351,9 @@ class ImproveWorker(QThread):
     def run(self):
         try:
             result = self.improver.improve_sync(self.prompt, self.timeout)
-            self.finished.emit(result)
+            self.signals.finished.emit(result)
         except Exception as e:
-            self.error.emit(str(e))
+            self.signals.error.emit(str(e))
 
 
 class RequestTab(QWidget):
@@ -678,13 +1362,36 @@ class RequestTab(QWidget):
     request_sent = pyqtSignal(str, list)  # prompt, models
     improve_requested = pyqtSignal(str)  # prompt для улучшения
 
-    def __init__(self, db: Database, model_manager: ModelManager, i18n: I18n, parent=None):
+    def __init__(
+        self,
+        db: Database,
+        db_worker: DbWorker,
+        model_manager: ModelManager,
+        i18n: I18n,
+        parent=None,
+    ):
         super().__init__(parent)
         self.db = db
+        self.db_worker = db_worker
+        self.db_worker.prompts_loaded.connect(self.on_prompts_loaded)
         self.model_manager = model_manager
         self.i18n = i18n
+        self.viewer: Optional[MarkdownViewerDialog] = None
+        # Список промптов читается при первом показе вкладки
+        self.prompts_loaded = False
+        # Серия сохранений/удалений подряд перечитывает список один раз
+        self.prompts_timer = QTimer(self)
+        self.prompts_timer.setSingleShot(True)
+        self.prompts_timer.setInterval(100)
+        self.prompts_timer.timeout.connect(self.fetch_saved_prompts)
         self.setup_ui()
 
+    def showEvent(self, event):
+        if not self.prompts_loaded:
+            self.prompts_loaded = True
+            self.fetch_saved_prompts()
+        super().showEvent(event)
+
     def setup_ui(self):
         layout = QVBoxLayout(self)
         layout.setSpacing(15)
@@ -692,51 +1399,24 @@ class RequestTab(QWidget):
         # Заголовок и CRUD кнопки
         header_layout = QHBoxLayout()
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title_label.setObjectName("title")
         header_layout.addWidget(self.title_label)
         header_layout.addStretch()
 
         # CRUD кнопки для промптов
         self.view_prompt_btn = QPushButton()
         self.view_prompt_btn.clicked.connect(self.view_prompt)
-        self.view_prompt_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #8e44ad; }
-        """)
+        self.view_prompt_btn.setObjectName("accent")
         header_layout.addWidget(self.view_prompt_btn)
 
         self.edit_prompt_btn = QPushButton()
         self.edit_prompt_btn.clicked.connect(self.edit_prompt)
-        self.edit_prompt_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #2980b9; }
-        """)
+        self.edit_prompt_btn.setObjectName("primary")
         header_layout.addWidget(self.edit_prompt_btn)
 
         self.delete_prompt_btn = QPushButton()
         self.delete_prompt_btn.clicked.connect(self.delete_prompt)
-        self.delete_prompt_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #c0392b; }
-        """)
+        self.delete_prompt_btn.setObjectName("danger")
         header_layout.addWidget(self.delete_prompt_btn)
 
         layout.addLayout(header_layout)
@@ -776,19 +1456,8 @@ class RequestTab(QWidget):
 
         self.save_prompt_btn = QPushButton()
         self.save_prompt_btn.clicked.connect(self.save_prompt)
-        self.save_prompt_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #95a5a6;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #7f8c8d;
-            }
-        """)
+        self.save_prompt_btn.setObjectName("muted")
+        self.save_prompt_btn.setProperty("size", "large")
         buttons_layout.addWidget(self.save_prompt_btn)
 
         buttons_layout.addStretch()
@@ -797,44 +1466,14 @@ class RequestTab(QWidget):
         self.improve_btn = QPushButton()
         self.improve_btn.setToolTip("")
         self.improve_btn.clicked.connect(self.improve_prompt)
-        self.improve_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 12px 25px;
-                border-radius: 5px;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.improve_btn.setObjectName("success")
+        self.improve_btn.setProperty("size", "hero")
         buttons_layout.addWidget(self.improve_btn)
 
         self.send_btn = QPushButton()
         self.send_btn.clicked.connect(self.send_request)
-        self.send_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 12px 30px;
-                border-radius: 5px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-            QPushButton:disabled {
-                background-color: #bdc3c7;
-            }
-        """)
+        self.send_btn.setObjectName("primary")
+        self.send_btn.setProperty("size", "hero")
         buttons_layout.addWidget(self.send_btn)
 
         layout.addLayout(buttons_layout)
@@ -852,9 +1491,7 @@ class RequestTab(QWidget):
 
         layout.addStretch()
 
-        # Загрузка сохранённых промптов
         self.apply_translations()
-        self.load_saved_prompts()
 
     def apply_translations(self):
         """Применить переводы для вкладки."""
@@ -863,6 +1500,9 @@ class RequestTab(QWidget):
         self.edit_prompt_btn.setText(self.i18n.t("prompt_edit_btn"))
         self.delete_prompt_btn.setText(self.i18n.t("prompt_delete_btn"))
         self.saved_label.setText(self.i18n.t("request_saved_prompts"))
+        # Заглушка списка переводится на месте, без перечитывания промптов
+        if self.prompts_combo.count():
+            self.prompts_combo.setItemText(0, self.i18n.t("request_select_prompt_placeholder"))
         self.prompt_edit.setPlaceholderText(self.i18n.t("request_prompt_placeholder"))
         self.tags_label.setText(self.i18n.t("request_tags_label"))
         self.tags_edit.setPlaceholderText(self.i18n.t("request_tags_placeholder"))
@@ -872,13 +1512,29 @@ class RequestTab(QWidget):
         self.send_btn.setText(self.i18n.t("request_send_btn"))
 
     def load_saved_prompts(self):
-        """Загрузить список сохранённых промптов."""
-        self.prompts_combo.clear()
-        self.prompts_combo.addItem(self.i18n.t("request_select_prompt_placeholder"), None)
-        prompts = self.db.get_prompts(limit=50)
-        for prompt in prompts:
-            text = prompt["text"][:50] + "..." if len(prompt["text"]) > 50 else prompt["text"]
-            self.prompts_combo.addItem(text, prompt["id"])
+        """Запланировать обновление списка промптов (запросы за 100 мс сливаются)."""
+        self.prompts_timer.start()
+
+    def fetch_saved_prompts(self):
+        """Загрузить список сохранённых промптов (в фоновом потоке)."""
+        self.prompts_timer.stop()
+        self.db_worker.load_prompts(50)
+
+    def on_prompts_loaded(self, prompts: list):
+        """Заполнить список сохранённых промптов."""
+        combo = self.prompts_combo
+        # Пересборка списка не должна вызывать on_prompt_selected, а все
+        # строки добавляются одним addItems вместо addItem на каждую
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(
+            [self.i18n.t("request_select_prompt_placeholder")]
+            + [prompt["preview"] for prompt in prompts]
+        )
+        set_item_data = combo.setItemData
+        for row, prompt in enumerate(prompts, start=1):
+            set_item_data(row, prompt["id"])
+        combo.blockSignals(False)
 
     def on_prompt_selected(self, index):
         """Обработка выбора промпта из списка."""
@@ -909,13 +1565,13 @@ class RequestTab(QWidget):
             return
         prompt = self.db.get_prompt_by_id(prompt_id)
         if prompt:
-            dialog = MarkdownViewerDialog(
+            self.viewer = open_markdown_viewer(
+                self.viewer,
                 self.i18n.t("prompt_dialog_title"),
                 prompt["text"],
                 self.i18n,
                 self,
             )
-            dialog.exec_()
 
     def edit_prompt(self):
         """Редактировать выбранный промпт."""
@@ -990,11 +1646,21 @@ class RequestTab(QWidget):
 class ResultsTab(QWidget):
     """Вкладка «Результаты»."""
 
-    def __init__(self, db: Database, results_store: ResultsStore, i18n: I18n, parent=None):
+    def __init__(
+        self,
+        db: Database,
+        db_worker: DbWorker,
+        results_store: ResultsStore,
+        i18n: I18n,
+        parent=None,
+    ):
         super().__init__(parent)
         self.db = db
+        self.db_worker = db_worker
+        self.db_worker.results_saved.connect(self.on_results_saved)
         self.results_store = results_store
         self.i18n = i18n
+        self.viewer: Optional[MarkdownViewerDialog] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -1004,37 +1670,19 @@ class ResultsTab(QWidget):
         # Заголовок и CRUD кнопки
         header_layout = QHBoxLayout()
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title_label.setObjectName("title")
         header_layout.addWidget(self.title_label)
         header_layout.addStretch()
 
         # CRUD кнопки
         self.view_result_btn = QPushButton()
         self.view_result_btn.clicked.connect(self.view_selected_result)
-        self.view_result_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #8e44ad; }
-        """)
+        self.view_result_btn.setObjectName("accent")
         header_layout.addWidget(self.view_result_btn)
 
         self.delete_result_btn = QPushButton()
         self.delete_result_btn.clicked.connect(self.delete_selected_result)
-        self.delete_result_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #c0392b; }
-        """)
+        self.delete_result_btn.setObjectName("danger")
         header_layout.addWidget(self.delete_result_btn)
 
         layout.addLayout(header_layout)
@@ -1059,19 +1707,26 @@ class ResultsTab(QWidget):
         layout.addWidget(self.prompt_label)
 
         # Таблица результатов
-        self.results_table = QTableWidget()
-        self.results_table.setColumnCount(4)
-        self.results_table.setHorizontalHeaderLabels(["", "", "", ""])
+        self.results_model = ResultsTableModel(self.i18n, self)
+        self.results_proxy = QSortFilterProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
         self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.results_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        self.results_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.Fixed)
         self.results_table.setColumnWidth(0, 30)
+        self.results_table.setColumnWidth(4, 110)
+        self.open_delegate = ActionButtonDelegate(self.i18n, "results_open_btn", self)
+        self.open_delegate.clicked.connect(self.open_result)
+        self.results_table.setItemDelegateForColumn(4, self.open_delegate)
         self.results_table.setAlternatingRowColors(True)
-        self.results_table.setSortingEnabled(True)
+        enable_sorting_on_demand(self.results_table)
         self.results_table.setWordWrap(True)  # Перенос текста
         self.results_table.verticalHeader().setDefaultSectionSize(120)  # Высота строк
-        self.results_table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.results_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.results_table.doubleClicked.connect(self.view_selected_result)
         # Стили таблицы берутся из темы
         layout.addWidget(self.results_table)
@@ -1081,38 +1736,16 @@ class ResultsTab(QWidget):
 
         self.save_btn = QPushButton()
         self.save_btn.clicked.connect(self.save_selected)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.save_btn.setObjectName("success")
+        self.save_btn.setProperty("size", "large")
         buttons_layout.addWidget(self.save_btn)
 
         buttons_layout.addStretch()
 
         self.clear_btn = QPushButton()
         self.clear_btn.clicked.connect(self.clear_results)
-        self.clear_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
+        self.clear_btn.setObjectName("danger")
+        self.clear_btn.setProperty("size", "large")
         buttons_layout.addWidget(self.clear_btn)
 
         layout.addLayout(buttons_layout)
@@ -1126,72 +1759,32 @@ class ResultsTab(QWidget):
         self.delete_result_btn.setText(self.i18n.t("results_delete_btn"))
         self.select_all_btn.setText(self.i18n.t("results_select_all"))
         self.deselect_all_btn.setText(self.i18n.t("results_deselect_all"))
-        self.results_table.setHorizontalHeaderLabels(
-            [
-                self.i18n.t("results_table_select"),
-                self.i18n.t("results_table_model"),
-                self.i18n.t("results_table_response"),
-                self.i18n.t("results_table_tokens"),
-            ]
-        )
+        self.results_model.retranslate()
         self.save_btn.setText(self.i18n.t("results_save_btn"))
         self.clear_btn.setText(self.i18n.t("results_clear_btn"))
 
     def update_results(self):
         """Обновить таблицу результатов."""
-        self.results_table.setRowCount(0)
-
-        prompt = self.results_store.current_prompt
-        if prompt:
-            display_prompt = prompt[:200] + "..." if len(prompt) > 200 else prompt
+        display_prompt = self.results_store.prompt_preview
+        if display_prompt:
             self.prompt_label.setText(
                 self.i18n.t("results_prompt_prefix", prompt=display_prompt)
             )
         else:
             self.prompt_label.setText("")
 
-        for i, result in enumerate(self.results_store.results):
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-
-            # Чекбокс
-            checkbox = QCheckBox()
-            checkbox.setChecked(result.selected)
-            checkbox.stateChanged.connect(lambda state, idx=i: self.toggle_selection(idx))
-            self.results_table.setCellWidget(row, 0, checkbox)
-
-            # Модель
-            model_item = QTableWidgetItem(result.model_name)
-            if not result.success:
-                model_item.setForeground(Qt.red)
-            self.results_table.setItem(row, 1, model_item)
-
-            # Ответ (показываем больше текста)
-            response_text = result.response[:1000] + "..." if len(result.response) > 1000 else result.response
-            response_item = QTableWidgetItem(response_text)
-            response_item.setToolTip(result.response)
-            response_item.setTextAlignment(Qt.AlignTop | Qt.AlignLeft)
-            self.results_table.setItem(row, 2, response_item)
-
-            # Токены
-            tokens_item = QTableWidgetItem(str(result.tokens))
-            self.results_table.setItem(row, 3, tokens_item)
-
-        self.results_table.resizeRowsToContents()
-
-    def toggle_selection(self, index: int):
-        """Переключить выбор результата."""
-        self.results_store.toggle_selection(index)
+        with bulk_update(self.results_table):
+            self.results_model.set_rows(self.results_store.results)
 
     def select_all(self):
         """Выбрать все результаты."""
         self.results_store.select_all()
-        self.update_results()
+        self.results_model.refresh_column(0, [Qt.CheckStateRole])
 
     def deselect_all(self):
         """Снять выбор со всех."""
         self.results_store.deselect_all()
-        self.update_results()
+        self.results_model.refresh_column(0, [Qt.CheckStateRole])
 
     def save_selected(self):
         """Сохранить выбранные результаты."""
@@ -1215,12 +1808,17 @@ class ResultsTab(QWidget):
             for r in selected
         ]
 
-        self.db.save_results(results_to_save)
-        log_save_results(len(results_to_save))
+        self.save_btn.setEnabled(False)
+        self.db_worker.save_results(results_to_save)
+
+    def on_results_saved(self, count: int):
+        """Обработка завершения сохранения результатов."""
+        self.save_btn.setEnabled(True)
+        log_save_results(count)
         QMessageBox.information(
             self,
             self.i18n.t("success_title"),
-            self.i18n.t("results_save_success", count=len(results_to_save)),
+            self.i18n.t("results_save_success", count=count),
         )
 
     def clear_results(self):
@@ -1230,10 +1828,7 @@ class ResultsTab(QWidget):
 
     def get_selected_row(self) -> int:
         """Получить индекс выбранной строки."""
-        selected = self.results_table.selectedItems()
-        if not selected:
-            return -1
-        return selected[0].row()
+        return selected_source_row(self.results_table)
 
     def view_selected_result(self):
         """Просмотр выбранного результата."""
@@ -1245,9 +1840,14 @@ class ResultsTab(QWidget):
                 self.i18n.t("results_error_select_result"),
             )
             return
+        self.open_result(row)
+
+    def open_result(self, row: int):
+        """Открыть результат по индексу строки в Markdown."""
         result = self.results_store.results[row]
-        dialog = MarkdownViewerDialog(result.model_name, result.response, self.i18n, self)
-        dialog.exec_()
+        self.viewer = open_markdown_viewer(
+            self.viewer, result.model_name, result.response, self.i18n, self
+        )
 
     def delete_selected_result(self):
         """Удалить выбранный результат из временного хранилища."""
@@ -1277,6 +1877,7 @@ class ModelsTab(QWidget):
         super().__init__(parent)
         self.model_manager = model_manager
         self.i18n = i18n
+        self.viewer: Optional[MarkdownViewerDialog] = None
         self.setup_ui()
         self.load_models()
 
@@ -1287,58 +1888,34 @@ class ModelsTab(QWidget):
         # Заголовок и CRUD кнопки
         header_layout = QHBoxLayout()
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title_label.setObjectName("title")
         header_layout.addWidget(self.title_label)
         header_layout.addStretch()
 
         self.view_model_btn = QPushButton()
         self.view_model_btn.clicked.connect(self.view_model)
-        self.view_model_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #8e44ad; }
-        """)
+        self.view_model_btn.setObjectName("accent")
         header_layout.addWidget(self.view_model_btn)
 
         self.edit_model_btn = QPushButton()
         self.edit_model_btn.clicked.connect(self.edit_model)
-        self.edit_model_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #2980b9; }
-        """)
+        self.edit_model_btn.setObjectName("primary")
         header_layout.addWidget(self.edit_model_btn)
 
         self.delete_model_btn = QPushButton()
         self.delete_model_btn.clicked.connect(self.delete_selected_model)
-        self.delete_model_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #c0392b; }
-        """)
+        self.delete_model_btn.setObjectName("danger")
         header_layout.addWidget(self.delete_model_btn)
 
         layout.addLayout(header_layout)
 
         # Таблица моделей
-        self.models_table = QTableWidget()
-        self.models_table.setColumnCount(6)
-        self.models_table.setHorizontalHeaderLabels(["", "", "", "", "", ""])
+        self.models_model = ModelsTableModel(self.i18n, self)
+        self.models_model.active_toggled.connect(self.toggle_model)
+        self.models_proxy = QSortFilterProxyModel(self)
+        self.models_proxy.setSourceModel(self.models_model)
+        self.models_table = QTableView()
+        self.models_table.setModel(self.models_proxy)
         self.models_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.models_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.models_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
@@ -1347,8 +1924,8 @@ class ModelsTab(QWidget):
         self.models_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeToContents)
         self.models_table.setColumnWidth(0, 60)
         self.models_table.setAlternatingRowColors(True)
-        self.models_table.setSortingEnabled(True)
-        self.models_table.setSelectionBehavior(QTableWidget.SelectRows)
+        enable_sorting_on_demand(self.models_table)
+        self.models_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         layout.addWidget(self.models_table)
         
         # Кэш моделей для доступа по индексу
@@ -1391,18 +1968,7 @@ class ModelsTab(QWidget):
 
         self.add_btn = QPushButton()
         self.add_btn.clicked.connect(self.add_model)
-        self.add_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.add_btn.setObjectName("success")
         form_layout.addWidget(self.add_btn)
 
         layout.addWidget(form_frame)
@@ -1410,18 +1976,7 @@ class ModelsTab(QWidget):
         # Кнопка добавления моделей по умолчанию
         self.default_btn = QPushButton()
         self.default_btn.clicked.connect(self.add_default_models)
-        self.default_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.default_btn.setObjectName("primary")
         layout.addWidget(self.default_btn)
 
         self.apply_translations()
@@ -1432,16 +1987,7 @@ class ModelsTab(QWidget):
         self.view_model_btn.setText(self.i18n.t("models_view_btn"))
         self.edit_model_btn.setText(self.i18n.t("models_edit_btn"))
         self.delete_model_btn.setText(self.i18n.t("models_delete_btn"))
-        self.models_table.setHorizontalHeaderLabels(
-            [
-                self.i18n.t("models_table_active"),
-                self.i18n.t("models_table_name"),
-                self.i18n.t("models_table_provider"),
-                self.i18n.t("models_table_url"),
-                self.i18n.t("models_table_api_key"),
-                self.i18n.t("models_table_model_id"),
-            ]
-        )
+        self.models_model.retranslate()
         self.form_title.setText(self.i18n.t("models_form_title"))
         self.name_edit.setPlaceholderText(self.i18n.t("models_name_placeholder"))
         self.url_edit.setPlaceholderText(self.i18n.t("models_url_placeholder"))
@@ -1452,27 +1998,9 @@ class ModelsTab(QWidget):
 
     def load_models(self):
         """Загрузить список моделей."""
-        self.models_table.setRowCount(0)
         self.models_cache = self.model_manager.get_all_models()
-
-        for model in self.models_cache:
-            row = self.models_table.rowCount()
-            self.models_table.insertRow(row)
-
-            # Чекбокс активности
-            checkbox = QCheckBox()
-            checkbox.setChecked(bool(model["is_active"]))
-            checkbox.stateChanged.connect(
-                lambda state, mid=model["id"]: self.toggle_model(mid)
-            )
-            self.models_table.setCellWidget(row, 0, checkbox)
-
-            # Данные
-            self.models_table.setItem(row, 1, QTableWidgetItem(model["name"]))
-            self.models_table.setItem(row, 2, QTableWidgetItem(model["provider"]))
-            self.models_table.setItem(row, 3, QTableWidgetItem(model["api_url"]))
-            self.models_table.setItem(row, 4, QTableWidgetItem(model["api_key_env"]))
-            self.models_table.setItem(row, 5, QTableWidgetItem(model["model_id"]))
+        with bulk_update(self.models_table):
+            self.models_model.set_rows(self.models_cache)
 
     def add_model(self):
         """Добавить новую модель."""
@@ -1520,17 +2048,18 @@ class ModelsTab(QWidget):
         )
         if reply == QMessageBox.Yes:
             self.model_manager.delete_model(model_id)
-            self.load_models()
+            self.remove_model_row(model_id)
+
+    def remove_model_row(self, model_id: int):
+        """Убрать удалённую модель из таблицы без перезагрузки списка."""
+        for row, model in enumerate(self.models_model.rows):
+            if model["id"] == model_id:
+                self.models_model.remove_row(row)
+                break
 
     def get_selected_model(self) -> dict:
         """Получить выбранную модель."""
-        selected = self.models_table.selectedItems()
-        if not selected:
-            return None
-        row = selected[0].row()
-        if row < len(self.models_cache):
-            return self.models_cache[row]
-        return None
+        return self.models_model.row_at(selected_source_row(self.models_table))
 
     def view_model(self):
         """Просмотр выбранной модели."""
@@ -1551,8 +2080,7 @@ class ModelsTab(QWidget):
             f"**{self.i18n.t('models_info_active')}:** "
             f"{self.i18n.t('models_info_active_yes') if model['is_active'] else self.i18n.t('models_info_active_no')}\n"
         )
-        dialog = MarkdownViewerDialog(model['name'], info, self.i18n, self)
-        dialog.exec_()
+        self.viewer = open_markdown_viewer(self.viewer, model['name'], info, self.i18n, self)
 
     def edit_model(self):
         """Редактировать выбранную модель."""
@@ -1572,7 +2100,7 @@ class ModelsTab(QWidget):
         self.model_id_edit.setText(model['model_id'])
         # Удалить старую модель
         self.model_manager.delete_model(model['id'])
-        self.load_models()
+        self.remove_model_row(model['id'])
         QMessageBox.information(
             self,
             self.i18n.t("models_info_edit_title"),
@@ -1651,16 +2179,7 @@ class EditResultDialog(QDialog):
 
         save_btn = QPushButton(self.i18n.t("edit_result_save_btn"))
         save_btn.clicked.connect(self.accept)
-        save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #219a52; }
-        """)
+        save_btn.setObjectName("success")
         buttons_layout.addWidget(save_btn)
         layout.addLayout(buttons_layout)
 
@@ -1675,14 +2194,27 @@ class EditResultDialog(QDialog):
 class HistoryTab(QWidget):
     """Вкладка «История» с пагинацией и CRUD."""
 
-    def __init__(self, db: Database, i18n: I18n, parent=None):
+    _PAGE_CACHE_MAX = 32  # сколько страниц хранить в кэше
+
+    def __init__(self, db: Database, db_worker: DbWorker, i18n: I18n, parent=None):
         super().__init__(parent)
         self.db = db
+        self.db_worker = db_worker
+        self.db_worker.history_loaded.connect(self.on_history_loaded)
+        self.db_worker.result_updated.connect(self.on_result_updated)
+        self.db_worker.exported.connect(self.on_exported)
+        self.history_request_id = 0  # ответы на устаревшие запросы игнорируются
         self.i18n = i18n
+        self.viewer: Optional[MarkdownViewerDialog] = None
         self.current_page = 1
         self.page_size = 20
         self.total_rows = 0
+        self.total_pages = 1
         self.results_cache = []  # Кэш результатов для доступа по индексу
+        # (search, page_size, page) -> (page, total, rows): повторный переход
+        # на уже открытую страницу не обращается к базе
+        self._page_cache: OrderedDict = OrderedDict()
+        self._pending_page_key: Optional[tuple] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -1692,7 +2224,7 @@ class HistoryTab(QWidget):
         # Заголовок и поиск
         header_layout = QHBoxLayout()
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title_label.setObjectName("title")
         header_layout.addWidget(self.title_label)
 
         header_layout.addStretch()
@@ -1703,6 +2235,13 @@ class HistoryTab(QWidget):
         self.search_edit.returnPressed.connect(self.search_and_reset)
         header_layout.addWidget(self.search_edit)
 
+        # Поиск при вводе: запрос выполняется после 200 мс без нажатий
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(200)
+        self.search_timer.timeout.connect(self.search_and_reset)
+        self.search_edit.textChanged.connect(lambda _text: self.search_timer.start())
+
         refresh_btn = QPushButton("⟳")
         refresh_btn.setFixedWidth(30)
         refresh_btn.clicked.connect(self.load_history)
@@ -1715,44 +2254,17 @@ class HistoryTab(QWidget):
 
         self.view_btn = QPushButton()
         self.view_btn.clicked.connect(self.view_result)
-        self.view_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #9b59b6;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #8e44ad; }
-        """)
+        self.view_btn.setObjectName("accent")
         crud_layout.addWidget(self.view_btn)
 
         self.edit_btn = QPushButton()
         self.edit_btn.clicked.connect(self.edit_result)
-        self.edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #2980b9; }
-        """)
+        self.edit_btn.setObjectName("primary")
         crud_layout.addWidget(self.edit_btn)
 
         self.delete_btn = QPushButton()
         self.delete_btn.clicked.connect(self.delete_selected)
-        self.delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover { background-color: #c0392b; }
-        """)
+        self.delete_btn.setObjectName("danger")
         crud_layout.addWidget(self.delete_btn)
 
         crud_layout.addStretch()
@@ -1768,16 +2280,21 @@ class HistoryTab(QWidget):
         layout.addLayout(crud_layout)
 
         # Таблица истории
-        self.history_table = QTableWidget()
-        self.history_table.setColumnCount(4)
-        self.history_table.setHorizontalHeaderLabels(["", "", "", ""])
+        self.history_model = HistoryTableModel(self.i18n, self.db.get_result_by_id, self)
+        self.history_proxy = QSortFilterProxyModel(self)
+        self.history_proxy.setSourceModel(self.history_model)
+        self.history_table = QTableView()
+        self.history_table.setModel(self.history_proxy)
         self.history_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
         self.history_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
         self.history_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.Stretch)
         self.history_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.Stretch)
         self.history_table.setAlternatingRowColors(True)
-        self.history_table.setSortingEnabled(True)
-        self.history_table.setSelectionBehavior(QTableWidget.SelectRows)
+        # Одинаковая высота строк: превью короткие, измерять ячейки не нужно
+        self.history_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.history_table.verticalHeader().setDefaultSectionSize(36)
+        enable_sorting_on_demand(self.history_table)
+        self.history_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.history_table.doubleClicked.connect(self.view_result)
         layout.addWidget(self.history_table)
 
@@ -1835,65 +2352,54 @@ class HistoryTab(QWidget):
         self.delete_btn.setText(self.i18n.t("history_delete_btn"))
         self.export_md_btn.setText(self.i18n.t("history_export_md"))
         self.export_json_btn.setText(self.i18n.t("history_export_json"))
-        self.history_table.setHorizontalHeaderLabels(
-            [
-                self.i18n.t("history_table_date"),
-                self.i18n.t("history_table_model"),
-                self.i18n.t("history_table_prompt"),
-                self.i18n.t("history_table_response"),
-            ]
-        )
+        self.history_model.retranslate()
         self.page_size_label.setText(self.i18n.t("history_per_page_label"))
 
     def search_and_reset(self):
         """Сброс на первую страницу при поиске."""
+        self.search_timer.stop()
         self.current_page = 1
+        self.clear_page_cache()
         self.load_history()
 
-    def load_history(self):
-        """Загрузить историю с пагинацией."""
-        self.history_table.setRowCount(0)
-        search = self.search_edit.text().strip()
-
-        # Получить общее количество
-        all_results = self.db.get_results(search=search, limit=10000)
-        self.total_rows = len(all_results)
-
-        # Расчёт пагинации
-        total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
-        if self.current_page > total_pages:
-            self.current_page = total_pages
-
-        # Получить данные для текущей страницы
-        offset = (self.current_page - 1) * self.page_size
-        self.results_cache = self.db.get_results(
-            search=search, limit=self.page_size, offset=offset
-        )
-
-        for result in self.results_cache:
-            row = self.history_table.rowCount()
-            self.history_table.insertRow(row)
+    def clear_page_cache(self):
+        """Сбросить кэш страниц после изменения данных."""
+        self._page_cache.clear()
 
-            # Дата
-            date_item = QTableWidgetItem(result["created_at"])
-            self.history_table.setItem(row, 0, date_item)
-
-            # Модель
-            self.history_table.setItem(row, 1, QTableWidgetItem(result["model_name"]))
-
-            # Промпт
-            prompt_text = result["prompt_text"][:100] + "..." if len(result["prompt_text"]) > 100 else result["prompt_text"]
-            prompt_item = QTableWidgetItem(prompt_text)
-            prompt_item.setToolTip(result["prompt_text"])
-            self.history_table.setItem(row, 2, prompt_item)
-
-            # Ответ
-            response_text = result["response"][:100] + "..." if len(result["response"]) > 100 else result["response"]
-            response_item = QTableWidgetItem(response_text)
-            response_item.setToolTip(result["response"])
-            self.history_table.setItem(row, 3, response_item)
+    def load_history(self):
+        """Загрузить историю с пагинацией (из кэша или в фоновом потоке)."""
+        self.history_request_id += 1
+        key = (self.search_edit.text().strip(), self.page_size, self.current_page)
+        cached = self._page_cache.get(key)
+        if cached is not None:
+            self._page_cache.move_to_end(key)
+            self._pending_page_key = None
+            self.show_page(*cached)
+            return
+        self._pending_page_key = key
+        self.db_worker.load_history(self.history_request_id, *key)
 
-        self.history_table.resizeRowsToContents()
+    def on_history_loaded(self, request_id: int, page: int, total: int, rows: list):
+        """Запомнить загруженную страницу истории и показать её."""
+        if request_id != self.history_request_id:
+            return
+        if self._pending_page_key is not None:
+            self._page_cache[self._pending_page_key] = (page, total, rows)
+            if len(self._page_cache) > self._PAGE_CACHE_MAX:
+                self._page_cache.popitem(last=False)
+        self.show_page(page, total, rows)
+
+    def show_page(self, page: int, total: int, rows: list):
+        """Показать страницу истории."""
+        self.current_page = page
+        self.total_rows = total
+        self.results_cache = rows
+        # Число страниц считается один раз при получении итога и
+        # используется кнопками навигации
+        self.total_pages = total_pages = max(1, (total + self.page_size - 1) // self.page_size)
+
+        with bulk_update(self.history_table):
+            self.history_model.set_rows(self.results_cache)
 
         # Обновить метки пагинации
         self.page_label.setText(
@@ -1919,29 +2425,23 @@ class HistoryTab(QWidget):
             self.load_history()
 
     def go_next(self):
-        total_pages = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
-        if self.current_page < total_pages:
+        if self.current_page < self.total_pages:
             self.current_page += 1
             self.load_history()
 
     def go_last(self):
-        self.current_page = max(1, (self.total_rows + self.page_size - 1) // self.page_size)
+        self.current_page = self.total_pages
         self.load_history()
 
     def change_page_size(self, value: str):
         self.page_size = int(value)
         self.current_page = 1
+        self.clear_page_cache()
         self.load_history()
 
     def get_selected_result(self) -> dict:
         """Получить выбранный результат."""
-        selected = self.history_table.selectedItems()
-        if not selected:
-            return None
-        row = selected[0].row()
-        if row < len(self.results_cache):
-            return self.results_cache[row]
-        return None
+        return self.history_model.full_record(selected_source_row(self.history_table))
 
     def view_result(self):
         """Просмотр результата в Markdown."""
@@ -1953,8 +2453,9 @@ class HistoryTab(QWidget):
                 self.i18n.t("history_error_select_record"),
             )
             return
-        dialog = MarkdownViewerDialog(result["model_name"], result["response"], self.i18n, self)
-        dialog.exec_()
+        self.viewer = open_markdown_viewer(
+            self.viewer, result["model_name"], result["response"], self.i18n, self
+        )
 
     def edit_result(self):
         """Редактировать результат."""
@@ -1969,24 +2470,17 @@ class HistoryTab(QWidget):
 
         dialog = EditResultDialog(result, self.i18n, self)
         if dialog.exec_() == QDialog.Accepted:
-            values = dialog.get_values()
-            # Обновить в базе данных
-            cursor = self.db.connection.cursor()
-            cursor.execute(
-                """
-                UPDATE results 
-                SET model_name = ?, prompt_text = ?, response = ?
-                WHERE id = ?
-                """,
-                (values["model_name"], values["prompt_text"], values["response"], result["id"])
-            )
-            self.db.connection.commit()
-            self.load_history()
-            QMessageBox.information(
-                self,
-                self.i18n.t("success_title"),
-                self.i18n.t("history_edit_success"),
-            )
+            self.db_worker.update_result(result["id"], dialog.get_values())
+
+    def on_result_updated(self):
+        """Запись изменена в фоновом потоке."""
+        self.clear_page_cache()
+        self.load_history()
+        QMessageBox.information(
+            self,
+            self.i18n.t("success_title"),
+            self.i18n.t("history_edit_success"),
+        )
 
     def delete_selected(self):
         """Удалить выбранный результат."""
@@ -2007,14 +2501,14 @@ class HistoryTab(QWidget):
         )
         if reply == QMessageBox.Yes:
             self.db.delete_result(result["id"])
+            self.clear_page_cache()
             self.load_history()
 
     def export_markdown(self):
         """Экспорт в Markdown."""
         search = self.search_edit.text().strip()
-        results = self.db.get_results(search=search, limit=1000)
 
-        if not results:
+        if next(self.db.iter_results(search=search, limit=1), None) is None:
             QMessageBox.warning(
                 self,
                 self.i18n.t("error_title"),
@@ -2022,23 +2516,41 @@ class HistoryTab(QWidget):
             )
             return
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            self.i18n.t("history_export_title"),
+        self.ask_export_path(
             "export.md",
             self.i18n.t("history_export_markdown_filter"),
+            lambda file_path: self.write_markdown(file_path, search),
         )
-        if not file_path:
-            return
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(f"{self.i18n.t('history_export_header')}\n\n")
-            for r in results:
-                f.write(f"## {r['model_name']} — {r['created_at']}\n\n")
-                f.write(f"{self.i18n.t('history_export_prompt_label')} {r['prompt_text']}\n\n")
-                f.write(f"{self.i18n.t('history_export_response_label')}\n\n{r['response']}\n\n---\n\n")
+    def ask_export_path(self, default_name: str, name_filter: str, callback) -> None:
+        """
+        Открыть диалог сохранения без вложенного цикла событий.
+
+        Args:
+            default_name: Предлагаемое имя файла.
+            name_filter: Фильтр типов файлов.
+            callback: Вызывается с выбранным путём.
+        """
+        dialog = QFileDialog(self, self.i18n.t("history_export_title"))
+        dialog.setAcceptMode(QFileDialog.AcceptSave)
+        dialog.setNameFilter(name_filter)
+        dialog.selectFile(default_name)
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.fileSelected.connect(callback)
+        dialog.open()
+
+    def write_markdown(self, file_path: str, search: str):
+        """Записать результаты поиска в файл Markdown (в фоновом потоке)."""
+        labels = {
+            "header": self.i18n.t("history_export_header"),
+            "prompt": self.i18n.t("history_export_prompt_label"),
+            "response": self.i18n.t("history_export_response_label"),
+        }
+        self.db_worker.export_results("Markdown", file_path, search, labels)
 
-        log_export(file_path, "Markdown")
+    def on_exported(self, file_path: str, format_type: str):
+        """Файл экспорта записан в фоновом потоке."""
+        log_export(file_path, format_type)
         QMessageBox.information(
             self,
             self.i18n.t("success_title"),
@@ -2047,12 +2559,9 @@ class HistoryTab(QWidget):
 
     def export_json(self):
         """Экспорт в JSON."""
-        import json
-
         search = self.search_edit.text().strip()
-        results = self.db.get_results(search=search, limit=1000)
 
-        if not results:
+        if next(self.db.iter_results(search=search, limit=1), None) is None:
             QMessageBox.warning(
                 self,
                 self.i18n.t("error_title"),
@@ -2060,24 +2569,15 @@ class HistoryTab(QWidget):
             )
             return
 
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            self.i18n.t("history_export_title"),
+        self.ask_export_path(
             "export.json",
             self.i18n.t("history_export_json_filter"),
+            lambda file_path: self.write_json(file_path, search),
         )
-        if not file_path:
-            return
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
-
-        log_export(file_path, "JSON")
-        QMessageBox.information(
-            self,
-            self.i18n.t("success_title"),
-            self.i18n.t("history_export_success", path=file_path),
-        )
+    def write_json(self, file_path: str, search: str):
+        """Записать результаты поиска в файл JSON (в фоновом потоке)."""
+        self.db_worker.export_results("JSON", file_path, search, {})
 
 
 class AboutDialog(QDialog):
@@ -2101,7 +2601,6 @@ class AboutDialog(QDialog):
         
         # Иконка
         icon_label = QLabel()
-        import os
         # Пробуем загрузить PNG версию для лучшего качества
         png_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app_icon.png")
         ico_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.ico")
@@ -2120,11 +2619,11 @@ class AboutDialog(QDialog):
         # Название и версия
         title_layout = QVBoxLayout()
         app_name = QLabel("ChatList")
-        app_name.setStyleSheet("font-size: 24px; font-weight: bold; color: #2c3e50;")
+        app_name.setObjectName("appName")
         title_layout.addWidget(app_name)
         
         version = QLabel(self.i18n.t("about_version", version=__version__))
-        version.setStyleSheet("font-size: 14px; color: #7f8c8d;")
+        version.setObjectName("version")
         title_layout.addWidget(version)
         header_layout.addLayout(title_layout)
         header_layout.addStretch()
@@ -2133,24 +2632,24 @@ class AboutDialog(QDialog):
 
         # Описание
         description = QLabel(self.i18n.t("about_description"))
-        description.setStyleSheet("font-size: 13px; color: #34495e; line-height: 1.5;")
+        description.setObjectName("description")
         description.setWordWrap(True)
         layout.addWidget(description)
 
         # Разделитель
         separator = QFrame()
         separator.setFrameShape(QFrame.HLine)
-        separator.setStyleSheet("background-color: #dee2e6;")
+        separator.setObjectName("separator")
         layout.addWidget(separator)
 
         # Автор и ссылки
         author = QLabel(self.i18n.t("about_author"))
-        author.setStyleSheet("font-size: 12px; color: #95a5a6;")
+        author.setObjectName("author")
         layout.addWidget(author)
 
         github_link = QLabel('<a href="https://github.com/Evgen018/ChatList">GitHub: Evgen018/ChatList</a>')
         github_link.setOpenExternalLinks(True)
-        github_link.setStyleSheet("font-size: 12px;")
+        github_link.setObjectName("link")
         layout.addWidget(github_link)
 
         layout.addStretch()
@@ -2158,19 +2657,8 @@ class AboutDialog(QDialog):
         # Кнопка закрыть
         close_btn = QPushButton(self.i18n.t("about_close_btn"))
         close_btn.clicked.connect(self.accept)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 30px;
-                border-radius: 5px;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        close_btn.setObjectName("primary")
+        close_btn.setProperty("size", "large")
         layout.addWidget(close_btn, alignment=Qt.AlignCenter)
 
 
@@ -2180,6 +2668,7 @@ class SettingsTab(QWidget):
     # Сигнал об изменении настроек оформления
     appearance_changed = pyqtSignal()
     language_changed = pyqtSignal()
+    saved = pyqtSignal()
 
     def __init__(self, db: Database, i18n: I18n, parent=None):
         super().__init__(parent)
@@ -2194,12 +2683,13 @@ class SettingsTab(QWidget):
 
         # Заголовок
         self.title_label = QLabel()
-        self.title_label.setStyleSheet("font-size: 18px; font-weight: bold;")
+        self.title_label.setObjectName("title")
         layout.addWidget(self.title_label)
 
         # === Оформление ===
         self.appearance_title = QLabel()
-        self.appearance_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #9b59b6;")
+        self.appearance_title.setObjectName("sectionTitle")
+        self.appearance_title.setProperty("tone", "accent")
         layout.addWidget(self.appearance_title)
 
         # Язык
@@ -2237,12 +2727,13 @@ class SettingsTab(QWidget):
         # Разделитель
         separator1 = QFrame()
         separator1.setFrameShape(QFrame.HLine)
-        separator1.setStyleSheet("background-color: #dee2e6;")
+        separator1.setObjectName("separator")
         layout.addWidget(separator1)
 
         # === Запросы ===
         self.requests_title = QLabel()
-        self.requests_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #3498db;")
+        self.requests_title.setObjectName("sectionTitle")
+        self.requests_title.setProperty("tone", "primary")
         layout.addWidget(self.requests_title)
 
         # Таймаут
@@ -2272,12 +2763,13 @@ class SettingsTab(QWidget):
         # Разделитель
         separator2 = QFrame()
         separator2.setFrameShape(QFrame.HLine)
-        separator2.setStyleSheet("background-color: #dee2e6;")
+        separator2.setObjectName("separator")
         layout.addWidget(separator2)
 
         # === AI-ассистент ===
         self.ai_title = QLabel()
-        self.ai_title.setStyleSheet("font-size: 16px; font-weight: bold; color: #27ae60;")
+        self.ai_title.setObjectName("sectionTitle")
+        self.ai_title.setProperty("tone", "success")
         layout.addWidget(self.ai_title)
 
         # Выбор модели для улучшения
@@ -2297,13 +2789,13 @@ class SettingsTab(QWidget):
 
         # Подсказка
         self.hint_label = QLabel()
-        self.hint_label.setStyleSheet("font-style: italic;")
+        self.hint_label.setObjectName("hint")
         layout.addWidget(self.hint_label)
 
         # Разделитель
         separator3 = QFrame()
         separator3.setFrameShape(QFrame.HLine)
-        separator3.setStyleSheet("background-color: #dee2e6;")
+        separator3.setObjectName("separator")
         layout.addWidget(separator3)
 
         # Кнопки
@@ -2312,18 +2804,8 @@ class SettingsTab(QWidget):
         # Кнопка сохранения
         self.save_btn = QPushButton()
         self.save_btn.clicked.connect(self.save_settings)
-        self.save_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #27ae60;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #219a52;
-            }
-        """)
+        self.save_btn.setObjectName("success")
+        self.save_btn.setProperty("size", "large")
         buttons_layout.addWidget(self.save_btn)
 
         buttons_layout.addStretch()
@@ -2331,18 +2813,8 @@ class SettingsTab(QWidget):
         # Кнопка "О программе"
         self.about_btn = QPushButton()
         self.about_btn.clicked.connect(self.show_about)
-        self.about_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #3498db;
-                color: white;
-                border: none;
-                padding: 10px 20px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2980b9;
-            }
-        """)
+        self.about_btn.setObjectName("primary")
+        self.about_btn.setProperty("size", "large")
         buttons_layout.addWidget(self.about_btn)
 
         layout.addLayout(buttons_layout)
@@ -2352,19 +2824,19 @@ class SettingsTab(QWidget):
 
     def load_settings(self):
         """Загрузить настройки."""
-        timeout = self.db.get_setting("request_timeout", "60")
-        max_tokens = self.db.get_setting("max_tokens", "4096")
+        timeout = self.db.get_int_setting("request_timeout", 60)
+        max_tokens = self.db.get_int_setting("max_tokens", 4096)
         improve_model = self.db.get_setting(
             "improve_model",
             PromptImprover.RECOMMENDED_MODELS[0][1],
         )
         theme = self.db.get_setting("theme", "light")
-        font_size = self.db.get_setting("font_size", "10")
+        font_size = self.db.get_int_setting("font_size", 10)
         language = self.db.get_setting("language", "ru")
 
-        self.timeout_spin.setValue(int(timeout))
-        self.tokens_spin.setValue(int(max_tokens))
-        self.font_spin.setValue(int(font_size))
+        self.timeout_spin.setValue(timeout)
+        self.tokens_spin.setValue(max_tokens)
+        self.font_spin.setValue(font_size)
         
         # Установить тему
         theme_index = self.theme_combo.findData(theme)
@@ -2383,11 +2855,12 @@ class SettingsTab(QWidget):
 
     def save_settings(self):
         """Сохранить настройки."""
-        self.db.set_setting("request_timeout", str(self.timeout_spin.value()))
-        self.db.set_setting("max_tokens", str(self.tokens_spin.value()))
+        self.db.set_setting("request_timeout", self.timeout_spin.value())
+        self.db.set_setting("max_tokens", self.tokens_spin.value())
         self.db.set_setting("improve_model", self.improve_model_combo.currentData())
         self.db.set_setting("theme", self.theme_combo.currentData())
-        self.db.set_setting("font_size", str(self.font_spin.value()))
+        self.db.set_setting("font_size", self.font_spin.value())
+        self.saved.emit()
 
         selected_language = self.language_combo.currentData()
         if selected_language:
@@ -2476,12 +2949,12 @@ class MainWindow(QMainWindow):
             color: #3498db;
             font-weight: bold;
         }
-        QTableWidget {
+        QTableView {
             background-color: white;
             alternate-background-color: #f8f9fa;
             gridline-color: #dee2e6;
         }
-        QTableWidget::item {
+        QTableView::item {
             padding: 5px;
         }
         QHeaderView::section {
@@ -2513,7 +2986,7 @@ class MainWindow(QMainWindow):
             background-color: #3498db;
             border-radius: 5px;
         }
-    """
+    """ + APP_QSS
 
     # Стили для тёмной темы
     DARK_THEME = """
@@ -2538,13 +3011,13 @@ class MainWindow(QMainWindow):
             border-bottom: 2px solid #4fc3f7;
             color: #eaeaea;
         }
-        QTableWidget {
+        QTableView {
             background-color: #16213e;
             alternate-background-color: #1a1a2e;
             gridline-color: #3a3a5c;
             color: #eaeaea;
         }
-        QTableWidget::item {
+        QTableView::item {
             padding: 5px;
             color: #eaeaea;
         }
@@ -2617,7 +3090,7 @@ class MainWindow(QMainWindow):
             background-color: #e94560;
             border-radius: 5px;
         }
-    """
+    """ + APP_QSS
 
     def __init__(self):
         super().__init__()
@@ -2625,7 +3098,6 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1000, 700)
         
         # Установка иконки окна
-        import os
         icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app.ico")
         if os.path.exists(icon_path):
             self.setWindowIcon(QIcon(icon_path))
@@ -2636,8 +3108,36 @@ class MainWindow(QMainWindow):
         self.model_manager = ModelManager(self.db)
         self.results_store = ResultsStore()
         self.prompt_improver = PromptImprover(self.db)
-        self.worker = None
-        self.improve_worker = None
+
+        # Поток для запросов к базе данных из вкладок
+        self.db_thread = QThread(self)
+        self.db_worker = DbWorker(self.db.db_path)
+        self.db_worker.moveToThread(self.db_thread)
+        self.db_thread.finished.connect(self.db_worker.close, Qt.DirectConnection)
+        self.db_worker.error.connect(self.on_db_error)
+        self.db_thread.start()
+
+        # История перечитывается при открытии вкладки, только если изменилась
+        self.history_dirty = True
+        self.db_worker.results_saved.connect(lambda _count: self.invalidate_history())
+
+        # Таймаут запросов (None — не задан); перечитывается при сохранении настроек
+        self.request_timeout: Optional[int] = None
+        self.load_request_timeout()
+
+        # Задачи в очереди или в работе: ссылка держится, пока не отработает
+        # слот finished/error, иначе Python освободил бы QRunnable из пула
+        self.running_tasks: set = set()
+        # Постоянные потоки для запросов к API: отправка и улучшение
+        # промпта не ждут друг друга
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(2)
+        # Какие запросы к API сейчас выполняются (см. update_busy_state)
+        self.sending = False
+        self.improving = False
+
+        # Тема, уже применённая к окну
+        self.applied_theme: Optional[str] = None
 
         self.setup_ui()
         self.setup_connections()
@@ -2657,18 +3157,23 @@ class MainWindow(QMainWindow):
         self.tabs = QTabWidget()
         # Стили вкладок задаются через тему (LIGHT_THEME / DARK_THEME)
 
-        # Создание вкладок
-        self.request_tab = RequestTab(self.db, self.model_manager, self.i18n)
-        self.results_tab = ResultsTab(self.db, self.results_store, self.i18n)
-        self.models_tab = ModelsTab(self.model_manager, self.i18n)
-        self.history_tab = HistoryTab(self.db, self.i18n)
-        self.settings_tab = SettingsTab(self.db, self.i18n)
+        # Создание вкладок: сразу строится только «Запрос», остальные —
+        # при первом открытии (до этого на их месте пустые заглушки)
+        self.request_tab = RequestTab(self.db, self.db_worker, self.model_manager, self.i18n)
+        self.results_tab: Optional[ResultsTab] = None
+        self.models_tab: Optional[ModelsTab] = None
+        self.history_tab: Optional[HistoryTab] = None
+        self.settings_tab: Optional[SettingsTab] = None
+        self.lazy_tabs = {
+            1: self.create_results_tab,
+            2: self.create_models_tab,
+            3: self.create_history_tab,
+            4: self.create_settings_tab,
+        }
 
         self.tabs.addTab(self.request_tab, "")
-        self.tabs.addTab(self.results_tab, "")
-        self.tabs.addTab(self.models_tab, "")
-        self.tabs.addTab(self.history_tab, "")
-        self.tabs.addTab(self.settings_tab, "")
+        for _ in self.lazy_tabs:
+            self.tabs.addTab(QWidget(), "")
 
         # Переключение вкладок
         self.tabs.currentChanged.connect(self.on_tab_changed)
@@ -2679,24 +3184,65 @@ class MainWindow(QMainWindow):
         """Настройка сигналов и слотов."""
         self.request_tab.request_sent.connect(self.send_requests)
         self.request_tab.improve_requested.connect(self.improve_prompt)
+
+    def create_results_tab(self) -> QWidget:
+        self.results_tab = ResultsTab(self.db, self.db_worker, self.results_store, self.i18n)
+        self.results_tab.update_results()
+        return self.results_tab
+
+    def create_models_tab(self) -> QWidget:
+        self.models_tab = ModelsTab(self.model_manager, self.i18n)
+        return self.models_tab
+
+    def create_history_tab(self) -> QWidget:
+        self.history_tab = HistoryTab(self.db, self.db_worker, self.i18n)
+        self.history_dirty = True
+        return self.history_tab
+
+    def create_settings_tab(self) -> QWidget:
+        self.settings_tab = SettingsTab(self.db, self.i18n)
         self.settings_tab.appearance_changed.connect(self.apply_appearance)
         self.settings_tab.language_changed.connect(self.apply_language)
+        self.settings_tab.saved.connect(self.load_request_timeout)
+        return self.settings_tab
+
+    def load_request_timeout(self) -> None:
+        """Прочитать таймаут запросов из настроек."""
+        self.request_timeout = self.db.get_int_setting("request_timeout")
+
+    def ensure_tab(self, index: int) -> None:
+        """Построить вкладку вместо заглушки, если она ещё не создана."""
+        factory = self.lazy_tabs.pop(index, None)
+        if factory is None:
+            return
+        current = self.tabs.currentIndex()
+        text = self.tabs.tabText(index)
+        placeholder = self.tabs.widget(index)
+        # Замена вкладки и первичное заполнение — одной перерисовкой
+        self.tabs.setUpdatesEnabled(False)
+        self.tabs.blockSignals(True)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, factory(), text)
+        self.tabs.setCurrentIndex(current)
+        self.tabs.blockSignals(False)
+        self.tabs.setUpdatesEnabled(True)
+        placeholder.deleteLater()
 
     def apply_appearance(self):
         """Применить настройки оформления (тема и размер шрифта)."""
         # Получить настройки
         theme = self.db.get_setting("theme", "light")
-        font_size = int(self.db.get_setting("font_size", "10"))
+        font_size = self.db.get_int_setting("font_size", 10)
         
-        # Применить тему
-        if theme == "dark":
-            self.setStyleSheet(self.DARK_THEME)
-        else:
-            self.setStyleSheet(self.LIGHT_THEME)
+        # Применить тему: setStyleSheet заново разбирает QSS и переполирует
+        # все виджеты, поэтому при сохранении без смены темы он не вызывается
+        if theme != self.applied_theme:
+            self.setStyleSheet(self.DARK_THEME if theme == "dark" else self.LIGHT_THEME)
+            self.applied_theme = theme
         
         # Применить размер шрифта
         app = QApplication.instance()
-        if app:
+        if app and app.font().pointSize() != font_size:
             font = app.font()
             font.setPointSize(font_size)
             app.setFont(font)
@@ -2711,18 +3257,31 @@ class MainWindow(QMainWindow):
         self.tabs.setTabText(4, self.i18n.t("tab_settings"))
 
         self.request_tab.apply_translations()
-        self.request_tab.load_saved_prompts()
-        self.results_tab.apply_translations()
-        self.results_tab.update_results()
-        self.models_tab.apply_translations()
-        self.history_tab.apply_translations()
-        self.history_tab.load_history()
-        self.settings_tab.apply_translations()
+        # Ещё не созданные вкладки переведутся при построении
+        if self.results_tab:
+            self.results_tab.apply_translations()
+            self.results_tab.update_results()
+        if self.models_tab:
+            self.models_tab.apply_translations()
+        if self.history_tab:
+            self.history_tab.apply_translations()
+        self.invalidate_history()
+        if self.settings_tab:
+            self.settings_tab.apply_translations()
+
+    def invalidate_history(self):
+        """Пометить историю устаревшей; видимая вкладка обновляется сразу."""
+        self.history_dirty = True
+        if self.tabs.currentIndex() == 3:
+            self.on_tab_changed(3)
 
     def on_tab_changed(self, index: int):
         """Обработка переключения вкладок."""
+        self.ensure_tab(index)
         # Обновление данных при переключении на вкладку История
-        if index == 3:  # История
+        if index == 3 and self.history_dirty:  # История
+            self.history_dirty = False
+            self.history_tab.clear_page_cache()
             self.history_tab.load_history()
 
     def send_requests(self, prompt: str, models: list):
@@ -2731,51 +3290,78 @@ class MainWindow(QMainWindow):
         log_request(prompt, models)
 
         # Показать прогресс
-        self.request_tab.progress.setVisible(True)
-        self.request_tab.progress.setRange(0, 0)  # Indeterminate
-        self.request_tab.send_btn.setEnabled(False)
+        self.sending = True
+        self.update_busy_state()
         self.request_tab.status_label.setText(
             self.i18n.t("request_status_sending", count=len(models))
         )
 
-        # Получить таймаут из настроек
-        timeout = int(self.db.get_setting("request_timeout", "60"))
+        timeout = self.request_timeout or 60
 
         # Запуск воркера
-        self.worker = RequestWorker(prompt, models, timeout)
-        self.worker.finished.connect(self.on_requests_finished)
-        self.worker.error.connect(self.on_requests_error)
-        self.worker.start()
+        self.start_task(
+            RequestRunnable(prompt, models, timeout),
+            self.on_requests_finished,
+            self.on_requests_error,
+        )
 
-    def on_requests_finished(self, results: list):
+    def update_busy_state(self):
+        """Показать прогресс и заблокировать кнопки, пока идёт любой запрос к API."""
+        busy = self.sending or self.improving
+        self.request_tab.progress.setRange(0, 0)  # Indeterminate
+        self.request_tab.progress.setVisible(busy)
+        self.request_tab.send_btn.setEnabled(not busy)
+        self.request_tab.improve_btn.setEnabled(not busy)
+
+    def start_task(self, task: QRunnable, on_finished, on_error):
+        """
+        Запустить задачу в пуле потоков.
+
+        Args:
+            task: Задача с атрибутом signals (finished, error).
+            on_finished: Слот для сигнала finished.
+            on_error: Слот для сигнала error.
+        """
+        self.running_tasks.add(task)
+        task.signals.finished.connect(on_finished)
+        task.signals.error.connect(on_error)
+        # Подключено последним — выполняется после слотов обработки
+        release = lambda *_: self.running_tasks.discard(task)
+        task.signals.finished.connect(release)
+        task.signals.error.connect(release)
+        self.thread_pool.start(task)
+
+    def on_requests_finished(self, prompt: str, results: list):
         """Обработка завершения запросов."""
-        self.request_tab.progress.setVisible(False)
-        self.request_tab.send_btn.setEnabled(True)
+        self.sending = False
+        self.update_busy_state()
         self.request_tab.status_label.setText(
             self.i18n.t("request_status_received", count=len(results))
         )
 
         # Логирование результатов
-        for r in results:
-            log_response(
-                r.get("model_name", "Unknown"),
-                r.get("success", False),
-                r.get("tokens", 0),
-                r.get("error"),
-            )
+        log_responses(results)
 
         # Сохранить результаты
-        self.results_store.set_results(self.worker.prompt, results)
-        self.results_tab.update_results()
+        self.results_store.set_results(prompt, results)
 
-        # Переключиться на вкладку результатов
+        # Перестроение таблицы — в следующей итерации цикла событий, чтобы
+        # скрытие прогресса и новый статус отрисовались сразу
+        QTimer.singleShot(0, self.refresh_results_ui)
+
+    def refresh_results_ui(self):
+        """Обновить и показать вкладку результатов за одну перерисовку."""
+        self.tabs.setUpdatesEnabled(False)
+        if self.results_tab:
+            self.results_tab.update_results()
         self.tabs.setCurrentIndex(1)
+        self.tabs.setUpdatesEnabled(True)
 
     def on_requests_error(self, error: str):
         """Обработка ошибки запросов."""
         log_error("Ошибка при отправке запросов", Exception(error))
-        self.request_tab.progress.setVisible(False)
-        self.request_tab.send_btn.setEnabled(True)
+        self.sending = False
+        self.update_busy_state()
         self.request_tab.status_label.setText(
             self.i18n.t("request_status_error", error=error)
         )
@@ -2784,26 +3370,23 @@ class MainWindow(QMainWindow):
     def improve_prompt(self, prompt: str):
         """Улучшить промпт через AI-ассистент."""
         # Показать прогресс
-        self.request_tab.progress.setVisible(True)
-        self.request_tab.progress.setRange(0, 0)
-        self.request_tab.improve_btn.setEnabled(False)
-        self.request_tab.send_btn.setEnabled(False)
+        self.improving = True
+        self.update_busy_state()
         self.request_tab.status_label.setText(self.i18n.t("improve_status_running"))
 
-        # Получить таймаут
-        timeout = int(self.db.get_setting("request_timeout", "90"))
+        timeout = self.request_timeout or 90
 
         # Запустить воркер
-        self.improve_worker = ImproveWorker(prompt, self.prompt_improver, timeout)
-        self.improve_worker.finished.connect(self.on_improve_finished)
-        self.improve_worker.error.connect(self.on_improve_error)
-        self.improve_worker.start()
+        self.start_task(
+            ImproveRunnable(prompt, self.prompt_improver, timeout),
+            self.on_improve_finished,
+            self.on_improve_error,
+        )
 
     def on_improve_finished(self, result: ImprovedPrompt):
         """Обработка результата улучшения промпта."""
-        self.request_tab.progress.setVisible(False)
-        self.request_tab.improve_btn.setEnabled(True)
-        self.request_tab.send_btn.setEnabled(True)
+        self.improving = False
+        self.update_busy_state()
 
         if not result.success:
             self.request_tab.status_label.setText(
@@ -2825,9 +3408,8 @@ class MainWindow(QMainWindow):
 
     def on_improve_error(self, error: str):
         """Обработка ошибки улучшения."""
-        self.request_tab.progress.setVisible(False)
-        self.request_tab.improve_btn.setEnabled(True)
-        self.request_tab.send_btn.setEnabled(True)
+        self.improving = False
+        self.update_busy_state()
         self.request_tab.status_label.setText(
             self.i18n.t("request_status_error", error=error)
         )
@@ -2837,9 +3419,18 @@ class MainWindow(QMainWindow):
             self.i18n.t("improve_error_generic", error=error),
         )
 
+    def on_db_error(self, error: str):
+        """Обработка ошибки фонового запроса к базе данных."""
+        log_error("Ошибка базы данных", Exception(error))
+        if self.results_tab:
+            self.results_tab.save_btn.setEnabled(True)
+        QMessageBox.critical(self, self.i18n.t("error_title"), error)
+
     def closeEvent(self, event):
         """Обработка закрытия окна."""
         log_app_close()
+        self.db_thread.quit()
+        self.db_thread.wait()
         self.db.close()
         event.accept()
 
@@ -2851,9 +3442,10 @@ def main():
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
 
-    # Шрифт по умолчанию
-    font = QFont("Segoe UI", 10)
-    app.setFont(font)
+    # Шрифт по умолчанию: Segoe UI есть только в Windows, на других системах
+    # Qt искал бы замену; размер затем задаёт apply_appearance
+    if sys.platform == "win32":
+        app.setFont(QFont("Segoe UI", 10))
 
     window = MainWindow()
     window.show()
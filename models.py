@@ -4,12 +4,11 @@
 
 import os
 import re
-import asyncio
 from dataclasses import dataclass, field
 from typing import Optional
 
 from db import Database
-from network import get_client, OpenRouterClient
+from network import get_client, OpenRouterClient, run_sync
 
 
 # Системный промпт для AI-ассистента улучшения промптов
@@ -52,6 +51,7 @@ class TempResult:
     selected: bool = False
     success: bool = True
     error: Optional[str] = None
+    preview: str = ""  # Готовый текст для таблицы результатов
 
 
 @dataclass
@@ -72,6 +72,7 @@ class ResultsStore:
         """Инициализация хранилища."""
         self._results: list[TempResult] = []
         self._current_prompt: str = ""
+        self._prompt_preview: str = ""
 
     @property
     def results(self) -> list[TempResult]:
@@ -83,6 +84,11 @@ class ResultsStore:
         """Получить текущий промпт."""
         return self._current_prompt
 
+    @property
+    def prompt_preview(self) -> str:
+        """Получить текущий промпт, обрезанный для заголовка результатов."""
+        return self._prompt_preview
+
     def set_results(self, prompt: str, results: list[dict]) -> None:
         """
         Установить новые результаты.
@@ -93,18 +99,21 @@ class ResultsStore:
         """
         self.clear()
         self._current_prompt = prompt
+        self._prompt_preview = prompt[:200] + "..." if len(prompt) > 200 else prompt
 
         for result in results:
+            response = result.get("response", "")
             self._results.append(
                 TempResult(
                     model_id=result.get("model_id", 0),
                     model_name=result.get("model_name", ""),
                     prompt_text=result.get("prompt_text", prompt),
-                    response=result.get("response", ""),
+                    response=response,
                     tokens=result.get("tokens", 0),
                     selected=False,
                     success=result.get("success", True),
                     error=result.get("error"),
+                    preview=result.get("preview", response),
                 )
             )
 
@@ -131,6 +140,7 @@ class ResultsStore:
         """Очистить хранилище."""
         self._results.clear()
         self._current_prompt = ""
+        self._prompt_preview = ""
 
     def is_empty(self) -> bool:
         """Проверить, пустое ли хранилище."""
@@ -148,14 +158,26 @@ class ModelManager:
             db: Экземпляр базы данных.
         """
         self.db = db
+        # Списки моделей из базы; сбрасываются при любом изменении моделей
+        self._active_cache: Optional[list[dict]] = None
+        self._all_cache: Optional[list[dict]] = None
+
+    def _invalidate(self) -> None:
+        """Сбросить закэшированные списки моделей."""
+        self._active_cache = None
+        self._all_cache = None
 
     def get_active_models(self) -> list[dict]:
         """Получить список активных моделей."""
-        return self.db.get_models(active_only=True)
+        if self._active_cache is None:
+            self._active_cache = self.db.get_models(active_only=True)
+        return list(self._active_cache)
 
     def get_all_models(self) -> list[dict]:
         """Получить список всех моделей."""
-        return self.db.get_models(active_only=False)
+        if self._all_cache is None:
+            self._all_cache = self.db.get_models(active_only=False)
+        return list(self._all_cache)
 
     def add_model(
         self,
@@ -172,6 +194,7 @@ class ModelManager:
         Returns:
             ID созданной модели.
         """
+        self._invalidate()
         return self.db.add_model(
             name=name,
             provider=provider,
@@ -183,14 +206,17 @@ class ModelManager:
 
     def update_model(self, model_id: int, **kwargs) -> bool:
         """Обновить модель."""
+        self._invalidate()
         return self.db.update_model(model_id, **kwargs)
 
     def delete_model(self, model_id: int) -> bool:
         """Удалить модель."""
+        self._invalidate()
         return self.db.delete_model(model_id)
 
     def toggle_model(self, model_id: int) -> bool:
         """Переключить активность модели."""
+        self._invalidate()
         return self.db.toggle_model_active(model_id)
 
     def validate_model(self, model: dict) -> tuple[bool, str]:
@@ -302,16 +328,15 @@ class ModelManager:
 
         existing_models = {m["name"] for m in self.get_all_models()}
 
-        for model in default_models:
-            if model["name"] not in existing_models:
-                self.add_model(
-                    name=model["name"],
-                    provider=model["provider"],
-                    api_url=model["api_url"],
-                    api_key_env=model["api_key_env"],
-                    model_id=model["model_id"],
-                    is_active=False,  # По умолчанию неактивны
-                )
+        # Все недостающие модели вставляются одной транзакцией
+        new_models = [
+            {**model, "is_active": False}  # По умолчанию неактивны
+            for model in default_models
+            if model["name"] not in existing_models
+        ]
+        if new_models:
+            self._invalidate()
+            self.db.add_models(new_models)
 
 
 class PromptImprover:
@@ -419,7 +444,7 @@ class PromptImprover:
         Returns:
             ImprovedPrompt с улучшенной версией и альтернативами.
         """
-        return asyncio.run(self.improve_async(original_prompt, timeout))
+        return run_sync(self.improve_async(original_prompt, timeout))
 
     def _parse_response(self, original: str, response_text: str) -> ImprovedPrompt:
         """
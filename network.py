@@ -3,8 +3,11 @@
 """
 
 import asyncio
+import atexit
 import os
+import threading
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from typing import Optional
 
@@ -14,6 +17,15 @@ from dotenv import load_dotenv
 # Загрузка переменных окружения
 load_dotenv()
 
+# Предел соединений общего HTTP-клиента (на все модели сразу)
+HTTP_MAX_CONNECTIONS = 32
+
+# Постоянный цикл событий в фоновом потоке для синхронных вызовов и общий
+# HTTP-клиент на нём: соединения и TLS-сессии живут между отправками
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+_shared_http: Optional[httpx.AsyncClient] = None
+
 
 @dataclass
 class APIResponse:
@@ -50,18 +62,30 @@ class BaseAPIClient(ABC):
         self.timeout = timeout
 
     @abstractmethod
-    async def send_message(self, prompt: str) -> APIResponse:
+    async def send_message(
+        self, prompt: str, http: Optional[httpx.AsyncClient] = None
+    ) -> APIResponse:
         """
         Отправить сообщение в API.
 
         Args:
             prompt: Текст промпта.
+            http: Общий HTTP-клиент; если не указан, создаётся свой.
 
         Returns:
             APIResponse с результатом.
         """
         pass
 
+    @asynccontextmanager
+    async def _http_client(self, http: Optional[httpx.AsyncClient]):
+        """Использовать общий HTTP-клиент или открыть временный."""
+        if http is not None:
+            yield http
+            return
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            yield client
+
     def is_configured(self) -> bool:
         """Проверить, настроен ли клиент."""
         return bool(self.api_key)
@@ -70,7 +94,9 @@ class BaseAPIClient(ABC):
 class OpenAIClient(BaseAPIClient):
     """Клиент для OpenAI-совместимых API (OpenAI, DeepSeek, Groq, Together)."""
 
-    async def send_message(self, prompt: str) -> APIResponse:
+    async def send_message(
+        self, prompt: str, http: Optional[httpx.AsyncClient] = None
+    ) -> APIResponse:
         """Отправить сообщение в OpenAI-совместимый API."""
         if not self.is_configured():
             return APIResponse(
@@ -91,11 +117,12 @@ class OpenAIClient(BaseAPIClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client(http) as client:
                 response = await client.post(
                     f"{self.api_url}/completions",
                     headers=headers,
                     json=data,
+                    timeout=self.timeout,
                 )
                 
                 # Обработка ошибок с детальным сообщением
@@ -150,7 +177,9 @@ class OpenAIClient(BaseAPIClient):
 class AnthropicClient(BaseAPIClient):
     """Клиент для Anthropic Claude API."""
 
-    async def send_message(self, prompt: str) -> APIResponse:
+    async def send_message(
+        self, prompt: str, http: Optional[httpx.AsyncClient] = None
+    ) -> APIResponse:
         """Отправить сообщение в Anthropic API."""
         if not self.is_configured():
             return APIResponse(
@@ -172,11 +201,12 @@ class AnthropicClient(BaseAPIClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client(http) as client:
                 response = await client.post(
                     self.api_url,
                     headers=headers,
                     json=data,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 result = response.json()
@@ -215,7 +245,9 @@ class AnthropicClient(BaseAPIClient):
 class GoogleClient(BaseAPIClient):
     """Клиент для Google Gemini API."""
 
-    async def send_message(self, prompt: str) -> APIResponse:
+    async def send_message(
+        self, prompt: str, http: Optional[httpx.AsyncClient] = None
+    ) -> APIResponse:
         """Отправить сообщение в Google Gemini API."""
         if not self.is_configured():
             return APIResponse(
@@ -235,11 +267,12 @@ class GoogleClient(BaseAPIClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client(http) as client:
                 response = await client.post(
                     url,
                     headers=headers,
                     json=data,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
                 result = response.json()
@@ -276,7 +309,9 @@ class GoogleClient(BaseAPIClient):
 class OpenRouterClient(BaseAPIClient):
     """Клиент для OpenRouter API (https://openrouter.ai/)."""
 
-    async def send_message(self, prompt: str) -> APIResponse:
+    async def send_message(
+        self, prompt: str, http: Optional[httpx.AsyncClient] = None
+    ) -> APIResponse:
         """Отправить сообщение в OpenRouter API."""
         if not self.is_configured():
             return APIResponse(
@@ -299,11 +334,12 @@ class OpenRouterClient(BaseAPIClient):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with self._http_client(http) as client:
                 response = await client.post(
                     f"{self.api_url}/chat/completions",
                     headers=headers,
                     json=data,
+                    timeout=self.timeout,
                 )
                 
                 # Обработка ошибок с детальным сообщением
@@ -379,8 +415,55 @@ def get_client(provider: str, api_url: str, api_key_env: str, model_id: str) ->
     return client_class(api_url, api_key_env, model_id)
 
 
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Получить фоновый цикл событий, запустив его при первом вызове."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="network-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def run_sync(coro):
+    """
+    Выполнить корутину в фоновом цикле событий и дождаться результата.
+
+    Args:
+        coro: Корутина.
+
+    Returns:
+        Результат корутины.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+def _get_shared_http() -> httpx.AsyncClient:
+    """Общий HTTP-клиент фонового цикла (вызывать только внутри него)."""
+    global _shared_http
+    if _shared_http is None:
+        _shared_http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=HTTP_MAX_CONNECTIONS)
+        )
+    return _shared_http
+
+
+@atexit.register
+def _close_shared_http() -> None:
+    """Закрыть общий HTTP-клиент при выходе."""
+    global _shared_http
+    if _shared_http is not None:
+        run_sync(_shared_http.aclose())
+        _shared_http = None
+
+
 async def send_to_models(
-    prompt: str, models: list[dict], timeout: int = 60
+    prompt: str,
+    models: list[dict],
+    timeout: int = 60,
+    http: Optional[httpx.AsyncClient] = None,
 ) -> list[dict]:
     """
     Отправить промпт во все указанные модели.
@@ -389,12 +472,13 @@ async def send_to_models(
         prompt: Текст промпта.
         models: Список моделей из базы данных.
         timeout: Таймаут запроса в секундах.
+        http: Общий HTTP-клиент (если не задан, открывается временный).
 
     Returns:
         Список результатов.
     """
 
-    async def send_single(model: dict) -> dict:
+    async def send_single(model: dict, http: httpx.AsyncClient) -> dict:
         client = get_client(
             provider=model["provider"],
             api_url=model["api_url"],
@@ -403,7 +487,7 @@ async def send_to_models(
         )
         client.timeout = timeout
 
-        response = await client.send_message(prompt)
+        response = await client.send_message(prompt, http)
 
         return {
             "model_id": model["id"],
@@ -415,8 +499,15 @@ async def send_to_models(
             "error": response.error,
         }
 
-    tasks = [send_single(model) for model in models]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    # Один клиент на все запросы: общий пул соединений и TLS-сессии
+    if http is not None:
+        tasks = [send_single(model, http) for model in models]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    else:
+        limits = httpx.Limits(max_connections=max(1, len(models)))
+        async with httpx.AsyncClient(timeout=timeout, limits=limits) as own_http:
+            tasks = [send_single(model, own_http) for model in models]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
 
     # Обработка исключений
     processed_results = []
@@ -443,6 +534,9 @@ def send_to_models_sync(
     """
     Синхронная обёртка для send_to_models.
 
+    Запросы выполняются в постоянном фоновом цикле событий через общий
+    HTTP-клиент, поэтому повторные отправки переиспользуют соединения.
+
     Args:
         prompt: Текст промпта.
         models: Список моделей из базы данных.
@@ -451,5 +545,8 @@ def send_to_models_sync(
     Returns:
         Список результатов.
     """
-    return asyncio.run(send_to_models(prompt, models, timeout))
+    async def send_shared() -> list[dict]:
+        return await send_to_models(prompt, models, timeout, _get_shared_http())
+
+    return run_sync(send_shared())
 
@@ -0,0 +1,91 @@
+"""
+Тесты экспорта результатов в JSON.
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from db import Database
+from export import write_json
+
+
+class WriteJsonTest(unittest.TestCase):
+    """Потоковая запись JSON совпадает с json.dumps."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "export.json")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def read(self) -> str:
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_empty(self):
+        write_json(self.path, iter([]))
+        self.assertEqual(self.read(), "[]")
+        self.assertEqual(json.loads(self.read()), [])
+
+    def test_round_trip(self):
+        rows = [
+            {"id": 1, "model_name": "GPT", "prompt_text": "Привет", "response": "a\nb"},
+            {"id": 2, "model_name": "Кими", "prompt_text": "\"q\"", "response": "", "tokens": None},
+        ]
+        write_json(self.path, iter(rows))
+        self.assertEqual(json.loads(self.read()), rows)
+        self.assertEqual(self.read(), json.dumps(rows, ensure_ascii=False, indent=2))
+
+    def test_single_row(self):
+        rows = [{"id": 1, "response": "ok"}]
+        write_json(self.path, iter(rows))
+        self.assertEqual(self.read(), json.dumps(rows, ensure_ascii=False, indent=2))
+
+
+class ExportFromDatabaseTest(unittest.TestCase):
+    """Экспорт прямо из курсора Database.iter_results без ограничения LIMIT."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "export.json")
+        self.db = Database(os.path.join(self.tmp.name, "chatlist.db"))
+
+    def tearDown(self):
+        self.db.close()
+        self.tmp.cleanup()
+
+    def export(self, search: str = "") -> list:
+        write_json(self.path, self.db.iter_results(search=search, limit=-1))
+        with open(self.path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_more_rows_than_batches_and_old_cap(self):
+        count = 1100  # больше пачки fetchmany (256) и прежнего лимита 1000
+        self.db.save_results(
+            [
+                {"prompt_text": f"prompt {i}", "model_name": "GPT", "response": f"ответ {i}"}
+                for i in range(count)
+            ]
+        )
+        exported = self.export()
+        self.assertEqual(len(exported), count)
+        self.assertEqual(
+            {r["response"] for r in exported}, {f"ответ {i}" for i in range(count)}
+        )
+
+    def test_no_matches(self):
+        self.db.save_results([{"prompt_text": "p", "model_name": "GPT", "response": "r"}])
+        self.assertEqual(self.export(search="nothing matches this"), [])
+
+    def test_empty_history(self):
+        self.assertEqual(self.export(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()